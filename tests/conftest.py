@@ -0,0 +1,8 @@
+import pathlib
+import sys
+
+# Make the in-tree ``zindi`` package importable when running pytest from anywhere.
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+
+# Module-level dict fixtures in these tests are MappingProxyType views shared by
+# every test: never mutate them, copy them (``dict(fixture)``) to vary one.
@@ -0,0 +1,69 @@
+import unittest
+from unittest.mock import Mock
+
+import requests
+
+from zindi.platform_api import ZindiPlatformAPI
+
+BASE_API = "https://api.example"
+AUTH_TOKEN = "test-token"
+
+
+# --- Test Class for Request Headers ---
+class TestAuthHeaders(unittest.TestCase):
+    def setUp(self):
+        self.session = Mock(spec=requests.Session)
+        self.session.get.return_value = self.session.post.return_value = Mock(
+            status_code=200, content=b'{"data": {}}'
+        )
+        self.session.delete.return_value = self.session.get.return_value
+        self.api = ZindiPlatformAPI(
+            base_api=BASE_API,
+            default_headers={"User-Agent": "test"},
+            session=self.session,
+        )
+
+    def assertAuthHeaders(self, verb):
+        headers = verb.call_args.kwargs["headers"]
+        self.assertEqual(headers["auth-token"], AUTH_TOKEN)
+        self.assertEqual(headers["User-Agent"], "test")
+
+    def test_leaderboard_sends_auth_token(self):
+        """Test the leaderboard request is authenticated by header."""
+        self.api.get_leaderboard(AUTH_TOKEN, "challenge-1", per_page=10, page=2)
+        self.assertAuthHeaders(self.session.get)
+        self.assertEqual(
+            self.session.get.call_args.kwargs["params"], {"page": 2, "per_page": 10}
+        )
+
+    def test_submission_history_has_no_body(self):
+        """Test the submission history GET sends no form body."""
+        self.api.get_submission_history(AUTH_TOKEN, "challenge-1")
+        self.assertAuthHeaders(self.session.get)
+        self.assertNotIn("data", self.session.get.call_args.kwargs)
+
+    def test_create_team_sends_auth_token(self):
+        """Test creating a team is authenticated by header."""
+        self.api.create_team(AUTH_TOKEN, "challenge-1", "team")
+        self.assertAuthHeaders(self.session.post)
+        self.assertEqual(self.session.post.call_args.kwargs["data"]["title"], "team")
+
+    def test_invite_to_team_sends_auth_token(self):
+        """Test a team invitation is authenticated by header only."""
+        self.api.invite_to_team(AUTH_TOKEN, "challenge-1", "friend")
+        self.assertAuthHeaders(self.session.post)
+        self.assertEqual(
+            self.session.post.call_args.kwargs["data"], {"username": "friend"}
+        )
+
+    def test_disband_team_sends_auth_token(self):
+        """Test disbanding a team is authenticated by header."""
+        self.api.disband_team(AUTH_TOKEN, "challenge-1")
+        self.assertAuthHeaders(self.session.delete)
+        self.assertEqual(
+            self.session.delete.call_args.args[0], f"{BASE_API}/challenge-1/my_team"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
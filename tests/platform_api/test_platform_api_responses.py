@@ -0,0 +1,51 @@
+import unittest
+from types import SimpleNamespace
+
+from zindi.platform_api import ZindiAPIError, ZindiPlatformAPI
+
+
+def _response(status_code, content):
+    """Build a minimal HTTP response carrying raw ``content`` bytes."""
+    return SimpleNamespace(
+        status_code=status_code, content=content, text=content.decode()
+    )
+
+
+# --- Test Class for Response Parsing ---
+class TestResponseData(unittest.TestCase):
+    def setUp(self):
+        self.api = ZindiPlatformAPI(base_api="https://api.example", default_headers={})
+        self.addCleanup(self.api.close)
+
+    def test_data_envelope_unwrapped(self):
+        """Test the ``data`` member of a successful payload is returned."""
+        data = self.api._response_data(_response(200, b'{"data": {"id": 1}}'))
+        self.assertEqual(data, {"id": 1})
+
+    def test_error_payload_returned(self):
+        """Test an error payload is left to the caller, even on a 4xx."""
+        body = b'{"data": {"errors": {"message": "already in"}}}'
+        data = self.api._response_data(_response(422, body))
+        self.assertEqual(data, {"errors": {"message": "already in"}})
+
+    def test_non_json_response(self):
+        """Test an HTML gateway page raises with its status code."""
+        with self.assertRaises(ZindiAPIError) as cm:
+            self.api._response_data(_response(502, b"<html>Bad Gateway</html>"))
+        self.assertEqual(cm.exception.status_code, 502)
+        self.assertIn("Bad Gateway", str(cm.exception))
+
+    def test_http_error_without_error_payload(self):
+        """Test a failed request without an error payload is raised."""
+        with self.assertRaises(ZindiAPIError) as cm:
+            self.api._response_data(_response(500, b'{"message": "oops"}'))
+        self.assertEqual(cm.exception.status_code, 500)
+
+    def test_raise_on_errors(self):
+        """Test error payloads become ZindiAPIError when checked."""
+        with self.assertRaises(ZindiAPIError):
+            self.api._raise_on_errors({"errors": "Wrong username or password"})
+
+
+if __name__ == "__main__":
+    unittest.main()
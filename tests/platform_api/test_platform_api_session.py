@@ -0,0 +1,47 @@
+import unittest
+from unittest.mock import Mock
+
+import requests
+
+from zindi.platform_api import ZindiPlatformAPI
+
+BASE_API = "https://api.zindi.africa"
+
+
+# --- Test Class for Session Ownership ---
+class TestSessionOwnership(unittest.TestCase):
+    def test_caller_session_used_and_left_open(self):
+        """Test a caller-provided session serves requests and is not closed."""
+        session = Mock(spec=requests.Session)
+        session.get.return_value = Mock(status_code=200, content=b'{"data": {}}')
+        api = ZindiPlatformAPI(base_api=BASE_API, default_headers={}, session=session)
+
+        api.get_competition("test-token", "challenge-1")
+        api.close()
+
+        session.get.assert_called_once()
+        self.assertEqual(session.get.call_args.args[0], f"{BASE_API}/challenge-1")
+        session.close.assert_not_called()
+
+
+# --- Test Class for Retry Policy ---
+class TestRetryPolicy(unittest.TestCase):
+    def setUp(self):
+        api = ZindiPlatformAPI(base_api=BASE_API, default_headers={})
+        self.addCleanup(api.close)
+        self.retries = api.session.get_adapter(BASE_API).max_retries
+
+    def test_post_not_retried(self):
+        """Test non-idempotent POST requests are never retried."""
+        self.assertNotIn("POST", self.retries.allowed_methods)
+        self.assertIn("GET", self.retries.allowed_methods)
+
+    def test_transient_statuses_retried(self):
+        """Test rate limiting and gateway errors are retried."""
+        for status in (429, 500, 502, 503, 504):
+            with self.subTest(status=status):
+                self.assertIn(status, self.retries.status_forcelist)
+
+
+if __name__ == "__main__":
+    unittest.main()
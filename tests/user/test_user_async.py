@@ -0,0 +1,54 @@
+import asyncio
+import unittest
+from types import MappingProxyType
+from unittest.mock import Mock, create_autospec, patch
+
+from zindi.async_user import AsyncZindian
+from zindi.user import Zindian
+
+MOCK_SIGNIN_SUCCESS = MappingProxyType(
+    {
+        "auth_token": "mock_token",
+        "user": {"username": "testuser", "id": 123},
+    }
+)
+
+
+# --- Test Class for the Async Facade ---
+class TestAsyncZindian(unittest.TestCase):
+    def setUp(self):
+        self.zindian = create_autospec(Zindian, instance=True)
+        self.user = AsyncZindian(self.zindian)
+
+    @patch("zindi.user.ZindiPlatformAPI.signin")
+    @patch("zindi.user.getpass")
+    def test_signin(self, mock_getpass, mock_signin):
+        """Test signing in wraps a freshly signed-in Zindian."""
+        mock_getpass.return_value = "password"
+        mock_signin.return_value = MOCK_SIGNIN_SUCCESS
+        user = asyncio.run(AsyncZindian.signin(username="testuser", to_print=False))
+        self.assertIsInstance(user.zindian, Zindian)
+        mock_signin.assert_called_once()
+
+    def test_methods_forward_arguments(self):
+        """Test awaited methods call the wrapped Zindian with the same arguments."""
+        self.zindian.leaderboard.return_value = {"rank": 2, "leaderboard": []}
+        response = asyncio.run(self.user.leaderboard(to_print=False, per_page=10))
+        self.zindian.leaderboard.assert_called_once_with(to_print=False, per_page=10)
+        self.assertEqual(response["rank"], 2)
+
+    def test_gather_properties(self):
+        """Test I/O properties can be awaited together."""
+        type(self.zindian).my_rank = property(Mock(return_value=3))
+        type(self.zindian).remaining_subimissions = property(Mock(return_value=5))
+
+        async def both():
+            return await asyncio.gather(
+                self.user.my_rank(), self.user.remaining_subimissions()
+            )
+
+        self.assertEqual(asyncio.run(both()), [3, 5])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,17 +1,28 @@
+import os
 import unittest
-from unittest.mock import patch
+from types import MappingProxyType
+from unittest.mock import Mock, patch
 
 from zindi.user import Zindian
 
 # Mock API responses
-MOCK_SIGNIN_SUCCESS = {
-    "auth_token": "mock_token",
-    "user": {"username": "testuser", "id": 123},
-}
+MOCK_SIGNIN_SUCCESS = MappingProxyType(
+    {
+        "auth_token": "mock_token",
+        "user": {"username": "testuser", "id": 123},
+    }
+)
 
 
 # --- Test Class for Authentication ---
 class TestUserAuth(unittest.TestCase):
+    def setUp(self):
+        """Make sure a ZINDI_PASSWORD from the environment cannot skip getpass."""
+        patcher = patch.dict(os.environ)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        os.environ.pop("ZINDI_PASSWORD", None)
+
     @patch("zindi.user.ZindiPlatformAPI.signin")
     @patch("zindi.user.getpass")
     def test_init_signin_success(self, mock_getpass, mock_signin):
@@ -20,7 +31,11 @@ class TestUserAuth(unittest.TestCase):
         mock_signin.return_value = MOCK_SIGNIN_SUCCESS
         user = Zindian(username="testuser")
         mock_getpass.assert_called_once()
-        mock_signin.assert_called_once_with(username="testuser", password="password")
+        self.assertEqual(mock_signin.call_count, 1)
+        self.assertEqual(
+            mock_signin.call_args.kwargs,
+            {"username": "testuser", "password": "password"},
+        )
         self.assertEqual(user._Zindian__auth_data, MOCK_SIGNIN_SUCCESS)
         self.assertFalse(user._Zindian__challenge_selected)
 
@@ -35,6 +50,29 @@ class TestUserAuth(unittest.TestCase):
         self.assertIn("Wrong username or password", str(cm.exception))
         mock_getpass.assert_called_once()
 
+    @patch("zindi.user.ZindiPlatformAPI.signin")
+    @patch("zindi.user.getpass")
+    def test_init_signin_env_password(self, mock_getpass, mock_signin):
+        """Test the ZINDI_PASSWORD variable is used instead of prompting."""
+        os.environ["ZINDI_PASSWORD"] = "envpassword"
+        mock_signin.return_value = MOCK_SIGNIN_SUCCESS
+        Zindian(username="testuser")
+        mock_getpass.assert_not_called()
+        self.assertEqual(
+            mock_signin.call_args.kwargs,
+            {"username": "testuser", "password": "envpassword"},
+        )
+
+    def test_close_releases_api_client(self):
+        """Test closing the user closes the API client's session."""
+        mock_api = Mock()
+        mock_api.signin.return_value = MOCK_SIGNIN_SUCCESS
+        user = Zindian(
+            username="testuser", fixed_password="password", api_client=mock_api
+        )
+        user.close()
+        mock_api.close.assert_called_once_with()
+
 
 if __name__ == "__main__":
     unittest.main()
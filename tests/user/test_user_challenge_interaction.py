@@ -1,86 +1,82 @@
+import contextlib
+import copy
 import datetime
+import os
 import unittest
-from unittest.mock import patch
-
-import pandas as pd
+from types import MappingProxyType
+from unittest.mock import create_autospec, patch
 
+from zindi.platform_api import ZindiAPIError, ZindiPlatformAPI
 from zindi.user import Zindian
 
 # Mock API responses (Copied from original file)
-MOCK_SIGNIN_SUCCESS = {
-    "auth_token": "mock_token",
-    "user": {"username": "testuser", "id": 123},
-}
-MOCK_LEADERBOARD_DATA = {
-    "data": [
-        {
-            "public_rank": 1,
-            "best_public_score": 0.95,
-            "user": {"username": "leader"},
-            "submission_count": 5,
-            "best_public_submitted_at": "2023-01-10T10:00:00Z",
-        },
-        {
-            "public_rank": 2,
-            "best_public_score": 0.92,
-            "user": {"username": "testuser"},
-            "submission_count": 3,
-            "best_public_submitted_at": "2023-01-09T15:30:00Z",
-        },
-        {
-            "public_rank": 3,
-            "best_public_score": 0.90,
-            "team": {"title": "Team Awesome", "id": "team-123"},
-            "submission_count": 8,
-            "best_public_submitted_at": "2023-01-11T08:00:00Z",
-        },
-    ]
-}
-MOCK_SUBMISSION_BOARD_DATA = {
-    "data": [
-        {
-            "id": "sub-1",
-            "status": "successful",
-            "created_at": (
-                datetime.datetime.now() - datetime.timedelta(hours=2)
-            ).isoformat()
-            + "Z",
-            "filename": "submission1.csv",
-            "public_score": 0.92,
-            "private_score": 0.91,
-            "comment": "First attempt",
-            "status_description": None,
-        },
-        {
-            "id": "sub-2",
-            "status": "failed",
-            "created_at": (
-                datetime.datetime.now() - datetime.timedelta(hours=1)
-            ).isoformat()
-            + "Z",
-            "filename": "submission2.csv",
-            "public_score": None,
-            "private_score": None,
-            "comment": "Second attempt",
-            "status_description": "Invalid format",
-        },
-        {
-            "id": "sub-3",
-            "status": "successful",
-            "created_at": (
-                datetime.datetime.now() - datetime.timedelta(days=1, hours=5)
-            ).isoformat()
-            + "Z",
-            "filename": "submission_old.csv",
-            "public_score": 0.90,
-            "private_score": 0.89,
-            "comment": "Old one",
-            "status_description": None,
-        },
-    ]
-}
-MOCK_CHALLENGE_DETAILS_DATA = {
-    "data": {
+MOCK_SIGNIN_SUCCESS = MappingProxyType(
+    {
+        "auth_token": "mock_token",
+        "user": {"username": "testuser", "id": 123},
+    }
+)
+MOCK_LEADERBOARD_DATA = [
+    {
+        "public_rank": 1,
+        "best_public_score": 0.95,
+        "user": {"username": "leader"},
+        "submission_count": 5,
+        "best_public_submitted_at": "2023-01-10T10:00:00Z",
+    },
+    {
+        "public_rank": 2,
+        "best_public_score": 0.92,
+        "user": {"username": "testuser"},
+        "submission_count": 3,
+        "best_public_submitted_at": "2023-01-09T15:30:00Z",
+    },
+    {
+        "public_rank": 3,
+        "best_public_score": 0.90,
+        "team": {"title": "Team Awesome", "id": "team-123"},
+        "submission_count": 8,
+        "best_public_submitted_at": "2023-01-11T08:00:00Z",
+    },
+]
+_NOW = datetime.datetime.now()
+_TS_2H_AGO = (_NOW - datetime.timedelta(hours=2)).isoformat() + "Z"
+_TS_1H_AGO = (_NOW - datetime.timedelta(hours=1)).isoformat() + "Z"
+_TS_OLD = (_NOW - datetime.timedelta(days=1, hours=5)).isoformat() + "Z"
+MOCK_SUBMISSION_BOARD_DATA = [
+    {
+        "id": "sub-1",
+        "status": "successful",
+        "created_at": _TS_2H_AGO,
+        "filename": "submission1.csv",
+        "public_score": 0.92,
+        "private_score": 0.91,
+        "comment": "First attempt",
+        "status_description": None,
+    },
+    {
+        "id": "sub-2",
+        "status": "failed",
+        "created_at": _TS_1H_AGO,
+        "filename": "submission2.csv",
+        "public_score": None,
+        "private_score": None,
+        "comment": "Second attempt",
+        "status_description": "Invalid format",
+    },
+    {
+        "id": "sub-3",
+        "status": "successful",
+        "created_at": _TS_OLD,
+        "filename": "submission_old.csv",
+        "public_score": 0.90,
+        "private_score": 0.89,
+        "comment": "Old one",
+        "status_description": None,
+    },
+]
+MOCK_CHALLENGE_DETAILS_DATA = MappingProxyType(
+    {
         "id": "challenge-2",
         "subtitle": "Challenge 2 Subtitle",
         "datafiles": [
@@ -96,23 +92,37 @@ MOCK_CHALLENGE_DETAILS_DATA = {
             },
         ],
     }
-}
-MOCK_SUBMIT_SUCCESS = {"data": {"id": "sub-new-123"}}
-MOCK_SUBMIT_FAILURE = {"data": {"errors": {"base": "Submission failed"}}}
+)
+MOCK_SUBMIT_SUCCESS = MappingProxyType({"id": "sub-new-123"})
+MOCK_SUBMIT_FAILURE = MappingProxyType({"errors": {"base": "Submission failed"}})
+EXPECTED_DOWNLOAD_FILES = ("Train.csv", "Test.csv", "SampleSubmission.csv")
+EXPECTED_AUTH = MappingProxyType(
+    {"auth_token": "mock_token", "challenge_id": "challenge-2"}
+)
+MOCK_SELECTED_CHALLENGE = MappingProxyType(
+    {"id": "challenge-2", "subtitle": "Challenge 2 Subtitle"}
+)
 
 
 # --- Base Class for Tests Requiring Authenticated User ---
 class AuthenticatedUserTestCase(unittest.TestCase):
-    @patch("zindi.user.ZindiPlatformAPI.signin")
-    @patch("zindi.user.getpass")
-    def setUp(self, mock_getpass, mock_signin):
-        """Set up a mocked Zindian instance for tests."""
-        mock_getpass.return_value = "password"
-        mock_signin.return_value = MOCK_SIGNIN_SUCCESS
-        self.user = Zindian(username="testuser")
-        # Prevent setUp mocks from interfering with test-specific mocks
-        mock_getpass.reset_mock()
-        mock_signin.reset_mock()
+    @classmethod
+    def setUpClass(cls):
+        """Sign in a mocked Zindian once, shared as a template by all tests."""
+        with (
+            patch("zindi.user.ZindiPlatformAPI.signin") as mock_signin,
+            patch("zindi.user.getpass") as mock_getpass,
+        ):
+            mock_getpass.return_value = "password"
+            mock_signin.return_value = MOCK_SIGNIN_SUCCESS
+            cls._template_user = Zindian(username="testuser")
+
+    def setUp(self):
+        """Give each test its own copy of the signed-in template."""
+        self.user = copy.copy(self._template_user)
+        self.user.invalidate_cache()  # copies must not share the template's cache
+        self.mock_api = create_autospec(ZindiPlatformAPI, instance=True, spec_set=True)
+        self.user._Zindian__api_client = self.mock_api
 
 
 # --- Test Class for Challenge Interaction (Download, Submit, Boards, Rank) ---
@@ -122,11 +132,13 @@ class TestUserChallengeInteraction(AuthenticatedUserTestCase):
         super().setUp()
         # Pre-select a challenge for these tests
         self.user._Zindian__challenge_selected = True
-        self.user._Zindian__challenge_data = pd.Series(
-            {"id": "challenge-2", "subtitle": "Challenge 2 Subtitle"}
-        )
+        self.user._Zindian__challenge_data = MOCK_SELECTED_CHALLENGE
         self.user._Zindian__api = f"{self.user._Zindian__base_api}/challenge-2"
 
+        isfile_patcher = patch("zindi.user.os.path.isfile", return_value=True)
+        self.mock_isfile = isfile_patcher.start()
+        self.addCleanup(isfile_patcher.stop)
+
     def test_download_dataset_not_selected_error(self):
         """Test downloading dataset before selecting a challenge (edge case)."""
         self.user._Zindian__challenge_selected = False  # Override setup
@@ -134,37 +146,61 @@ class TestUserChallengeInteraction(AuthenticatedUserTestCase):
             self.user.download_dataset()
         self.assertIn("select a challenge before", str(cm.exception))
 
-    @patch("zindi.user.os.makedirs")
-    @patch("zindi.user.os.path.isdir", return_value=False)
-    @patch("zindi.user.ZindiPlatformAPI.get_competition")
-    @patch("zindi.user.download")
-    def test_download_dataset_success(
-        self, mock_util_download, mock_get_competition, mock_isdir, mock_makedirs
-    ):
+    def test_download_dataset_success(self):
         """Test successful dataset download."""
-        mock_get_competition.return_value = MOCK_CHALLENGE_DETAILS_DATA["data"]
+        self.mock_api.get_competition.return_value = MOCK_CHALLENGE_DETAILS_DATA
         dest_folder = "./mock_dataset"
-        self.user.download_dataset(destination=dest_folder)
+        with contextlib.ExitStack() as stack:
+            mock_makedirs = stack.enter_context(patch("zindi.user.os.makedirs"))
+            mock_isdir = stack.enter_context(
+                patch("zindi.user.os.path.isdir", return_value=False)
+            )
+            mock_util_download = stack.enter_context(patch("zindi.user.download"))
+            downloaded = self.user.download_dataset(destination=dest_folder)
 
         mock_isdir.assert_called_once_with(dest_folder)
         mock_makedirs.assert_called_once_with(dest_folder, exist_ok=True)
-        mock_get_competition.assert_called_once_with(
-            auth_token="mock_token",
-            challenge_id="challenge-2",
+        self.mock_api.get_competition.assert_called_once_with(
+            **EXPECTED_AUTH,
         )
-        self.assertEqual(mock_util_download.call_count, 3)
+        files_url = f"{self.user._Zindian__base_api}/challenge-2/files"
         called_urls = [kwargs["url"] for _, kwargs in mock_util_download.call_args_list]
-        self.assertIn(
-            f"{self.user._Zindian__base_api}/challenge-2/files/Train.csv", called_urls
+        self.assertCountEqual(
+            called_urls, [f"{files_url}/{name}" for name in EXPECTED_DOWNLOAD_FILES]
         )
-        self.assertIn(
-            f"{self.user._Zindian__base_api}/challenge-2/files/Test.csv", called_urls
+        self.assertEqual(
+            downloaded,
+            [os.path.join(dest_folder, name) for name in EXPECTED_DOWNLOAD_FILES],
         )
-        self.assertIn(
-            f"{self.user._Zindian__base_api}/challenge-2/files/SampleSubmission.csv",
-            called_urls,
+
+    def test_download_dataset_skips_duplicate_files(self):
+        """Test a datafile listed twice is downloaded once."""
+        datafiles = MOCK_CHALLENGE_DETAILS_DATA["datafiles"]
+        self.mock_api.get_competition.return_value = {
+            "datafiles": [*datafiles, {**datafiles[0]}]
+        }
+        with (
+            patch("zindi.user.os.path.isdir", return_value=True),
+            patch("zindi.user.download") as mock_util_download,
+        ):
+            downloaded = self.user.download_dataset(destination="./mock_dataset")
+
+        self.assertEqual(mock_util_download.call_count, len(EXPECTED_DOWNLOAD_FILES))
+        self.assertEqual(
+            downloaded,
+            [os.path.join("./mock_dataset", name) for name in EXPECTED_DOWNLOAD_FILES],
         )
 
+    def test_download_dataset_error(self):
+        """Test a failing datafile download is raised to the caller."""
+        self.mock_api.get_competition.return_value = MOCK_CHALLENGE_DETAILS_DATA
+        with (
+            patch("zindi.user.os.path.isdir", return_value=True),
+            patch("zindi.user.download", side_effect=OSError("disk full")),
+        ):
+            with self.assertRaises(OSError):
+                self.user.download_dataset(destination="./mock_dataset")
+
     def test_submit_not_selected_error(self):
         """Test submitting before selecting a challenge (edge case)."""
         self.user._Zindian__challenge_selected = False  # Override setup
@@ -172,32 +208,29 @@ class TestUserChallengeInteraction(AuthenticatedUserTestCase):
             self.user.submit(filepaths=["./dummy.csv"])
         self.assertIn("select a challenge before", str(cm.exception))
 
-    @patch("zindi.user.os.path.isfile", return_value=True)
-    @patch("zindi.user.ZindiPlatformAPI.submit_file")
-    def test_submit_success(self, mock_submit_file, mock_isfile):
+    def test_submit_success(self):
         """Test successful submission."""
-        mock_submit_file.return_value = MOCK_SUBMIT_SUCCESS["data"]
+        self.mock_api.submit_file.return_value = MOCK_SUBMIT_SUCCESS
         filepath = "./submission.csv"
         comment = "Test submission"
         response = self.user.submit(filepaths=[filepath], comments=[comment])
 
-        mock_isfile.assert_called_once_with(filepath)
-        mock_submit_file.assert_called_once_with(
-            auth_token="mock_token",
-            challenge_id="challenge-2",
+        self.mock_isfile.assert_called_once_with(filepath)
+        self.mock_api.submit_file.assert_called_once_with(
+            **EXPECTED_AUTH,
             filepath=filepath,
             comment=comment,
         )
         self.assertEqual(response[0]["status"], "success")
         self.assertEqual(response[0]["submission_id"], "sub-new-123")
 
-    @patch("zindi.user.os.path.isfile", return_value=False)
     @patch("builtins.print")  # Mock print to check output
-    def test_submit_file_not_exist(self, mock_print, mock_isfile):
+    def test_submit_file_not_exist(self, mock_print):
         """Test submission when file does not exist."""
+        self.mock_isfile.return_value = False
         filepath = "./nonexistent.csv"
         self.user.submit(filepaths=[filepath])
-        mock_isfile.assert_called_once_with(filepath)
+        self.mock_isfile.assert_called_once_with(filepath)
         mock_print.assert_any_call(
             f"\n[ 🔴 ] File doesn't exists, please verify this filepath : {filepath}\n"
         )
@@ -213,17 +246,76 @@ class TestUserChallengeInteraction(AuthenticatedUserTestCase):
         self.assertEqual(response[0]["status"], "error")
         self.assertEqual(response[0]["errors"], "invalid_extension")
 
-    @patch("zindi.user.ZindiPlatformAPI.get_my_participation")
-    @patch("zindi.user.ZindiPlatformAPI.get_leaderboard")
-    def _leaderboard_success(self, mock_get, mock_my_participation):
+    @patch("builtins.print")
+    def test_submit_batch_keeps_order(self, mock_print):
+        """Test concurrent uploads are reported in the order they were given."""
+        self.mock_api.submit_file.side_effect = lambda **kwargs: (
+            MOCK_SUBMIT_FAILURE
+            if kwargs["filepath"] == "./b.csv"
+            else MOCK_SUBMIT_SUCCESS
+        )
+        filepaths = ["./a.csv", "./notes.txt", "./b.csv", "./c.csv"]
+        response = self.user.submit(filepaths=filepaths)
+
+        self.assertEqual([item["filepath"] for item in response], filepaths)
+        self.assertEqual(
+            [item["status"] for item in response],
+            ["success", "error", "error", "success"],
+        )
+        self.assertEqual(self.mock_api.submit_file.call_count, 3)
+
+    @patch("builtins.print")
+    def test_submit_batch_upload_raises(self, mock_print):
+        """Test one raising upload is reported per file and clears the cache."""
+        self.mock_api.get_submission_limits.return_value = {"today": 5}
+        self.assertEqual(self.user.remaining_subimissions, 5)
+
+        def submit_file(**kwargs):
+            if kwargs["filepath"] == "./b.csv":
+                raise ZindiAPIError("[ 🔴 ] upload failed", status_code=502)
+            return MOCK_SUBMIT_SUCCESS
+
+        self.mock_api.submit_file.side_effect = submit_file
+        filepaths = ["./a.csv", "./b.csv", "./c.csv"]
+        response = self.user.submit(filepaths=filepaths)
+
+        self.assertEqual(
+            [item["status"] for item in response], ["success", "error", "success"]
+        )
+        self.assertIn("upload failed", response[1]["errors"])
+        self.assertEqual(response[1]["status_code"], 502)
+        self.assertEqual(self.mock_api.submit_file.call_count, 3)
+
+        self.mock_api.get_submission_limits.return_value = {"today": 3}
+        self.assertEqual(self.user.remaining_subimissions, 3)
+
+    @patch("builtins.print")
+    def test_submit_batch_propagates_programming_errors(self, mock_print):
+        """Test unexpected errors in an upload are not reported as file errors."""
+        self.mock_api.submit_file.side_effect = TypeError("bad argument")
+        with self.assertRaises(TypeError):
+            self.user.submit(filepaths=["./a.csv"])
+
+    @patch("builtins.print")
+    def test_submit_requires_csv_suffix(self, mock_print):
+        """Test files without a .csv suffix are rejected before any upload."""
+        filepaths = ["csv", "./data.csv/notes", "./SUBMISSION.CSV"]
+        self.mock_api.submit_file.return_value = MOCK_SUBMIT_SUCCESS
+        response = self.user.submit(filepaths=filepaths)
+        self.assertEqual(
+            [item["status"] for item in response], ["error", "error", "success"]
+        )
+        self.mock_api.submit_file.assert_called_once()
+
+    def test_leaderboard_success(self):
         """Test fetching the leaderboard successfully."""
-        mock_get.return_value = MOCK_LEADERBOARD_DATA["data"]
-        mock_my_participation.return_value = {"public_rank": 2}
+        self.mock_api.get_leaderboard.return_value = MOCK_LEADERBOARD_DATA
+        self.mock_api.get_my_participation.return_value = {"public_rank": 2}
         self.user.leaderboard(to_print=False)
-        mock_get.assert_called_once()
+        self.mock_api.get_leaderboard.assert_called_once()
         self.assertEqual(len(self.user._Zindian__challengers_data), 3)
         self.assertEqual(self.user._Zindian__rank, 2)
-        mock_my_participation.assert_called_once()
+        self.mock_api.get_my_participation.assert_not_called()
 
     def test_leaderboard_not_selected_error(self):
         """Test fetching leaderboard before selecting a challenge (edge case)."""
@@ -232,35 +324,50 @@ class TestUserChallengeInteraction(AuthenticatedUserTestCase):
             self.user.leaderboard()
         self.assertIn("select a challenge before", str(cm.exception))
 
-    @patch("zindi.user.ZindiPlatformAPI.get_submission_history")
-    def test_submission_board_success(self, mock_get):
+    def test_submission_board_success(self):
         """Test fetching the submission board successfully."""
-        mock_get.return_value = MOCK_SUBMISSION_BOARD_DATA["data"]
+        self.mock_api.get_submission_history.return_value = MOCK_SUBMISSION_BOARD_DATA
         response = self.user.submission_board(to_print=False)
-        mock_get.assert_called_once()
+        self.mock_api.get_submission_history.assert_called_once()
         self.assertEqual(len(self.user._Zindian__sb_data), 3)
         self.assertEqual(len(response), 3)
 
-    @patch("zindi.user.ZindiPlatformAPI.get_my_participation")
-    @patch("zindi.user.ZindiPlatformAPI.get_leaderboard")
-    def test_leaderboard_success_return(self, mock_get, mock_my_participation):
+    def test_leaderboard_success_return(self):
         """Test leaderboard returns rank and rows."""
-        mock_get.return_value = MOCK_LEADERBOARD_DATA["data"]
-        mock_my_participation.return_value = {"public_rank": 2}
+        self.mock_api.get_leaderboard.return_value = MOCK_LEADERBOARD_DATA
+        self.mock_api.get_my_participation.return_value = {"public_rank": 2}
         response = self.user.leaderboard(to_print=False)
 
         self.assertEqual(response["rank"], 2)
         self.assertEqual(len(response["leaderboard"]), 3)
-        mock_my_participation.assert_called_once()
+        # The user's row is on the page, so no rank request is needed
+        self.mock_api.get_my_participation.assert_not_called()
+
+    def test_my_rank_reuses_leaderboard_rows(self):
+        """Test my_rank after leaderboard resolves the rank without new requests."""
+        self.mock_api.get_leaderboard.return_value = MOCK_LEADERBOARD_DATA
+        self.user.leaderboard(to_print=False)
+
+        self.assertEqual(self.user.my_rank, 2)
+        self.mock_api.get_leaderboard.assert_called_once()
+        self.mock_api.get_my_participation.assert_not_called()
+
+    def test_leaderboard_row_reports_public_rank(self):
+        """Test a leaderboard row gives the public rank my_participation reports."""
+        rows = [dict(row) for row in MOCK_LEADERBOARD_DATA]
+        rows[1]["private_rank"] = 7
+        self.mock_api.get_leaderboard.return_value = rows
+        self.mock_api.get_my_participation.return_value = {"public_rank": 2}
 
-    @patch("zindi.user.ZindiPlatformAPI.get_my_participation")
-    @patch("zindi.user.ZindiPlatformAPI.get_leaderboard")
-    def test_leaderboard_rank_independent_from_page(
-        self, mock_get, mock_my_participation
-    ):
+        self.assertEqual(self.user.leaderboard(to_print=False)["rank"], 2)
+        self.assertEqual(self.user.my_rank, 2)
+        self.user.invalidate_cache()
+        self.assertEqual(self.user.my_rank, 2)
+
+    def test_leaderboard_rank_independent_from_page(self):
         """Rank should not depend on per_page when API returns my participation rank."""
-        mock_get.return_value = MOCK_LEADERBOARD_DATA["data"][:1]
-        mock_my_participation.return_value = {"public_rank": 30}
+        self.mock_api.get_leaderboard.return_value = MOCK_LEADERBOARD_DATA[:1]
+        self.mock_api.get_my_participation.return_value = {"public_rank": 30}
 
         response = self.user.leaderboard(to_print=False, per_page=1)
 
@@ -273,10 +380,9 @@ class TestUserChallengeInteraction(AuthenticatedUserTestCase):
             self.user.submission_board()
         self.assertIn("select a challenge before", str(cm.exception))
 
-    @patch("zindi.user.ZindiPlatformAPI.get_my_participation")
-    def _my_rank_success(self, mock_get):
+    def _my_rank_success(self):
         """Test getting user rank."""
-        mock_get.return_value = {"public_rank": 2}
+        self.mock_api.get_my_participation.return_value = {"public_rank": 2}
         rank = self.user.my_rank
         self.assertEqual(rank, 2)
         self.assertEqual(self.user._Zindian__rank, 2)
@@ -287,18 +393,41 @@ class TestUserChallengeInteraction(AuthenticatedUserTestCase):
         rank = self.user.my_rank
         self.assertEqual(rank, 0)
 
-    @patch("zindi.user.ZindiPlatformAPI.get_leaderboard")
-    @patch("zindi.user.ZindiPlatformAPI.get_my_participation")
-    def test_my_rank_fallback_from_leaderboard(self, mock_my_participation, mock_lb):
+    def test_my_rank_fallback_from_leaderboard(self):
         """Test my_rank fallback when my_participation returns zero."""
-        mock_my_participation.return_value = {"public_rank": 0}
-        mock_lb.return_value = MOCK_LEADERBOARD_DATA["data"]
+        self.mock_api.get_my_participation.return_value = {"public_rank": 0}
+        self.mock_api.get_leaderboard.return_value = MOCK_LEADERBOARD_DATA
 
         rank = self.user.my_rank
 
         self.assertEqual(rank, 2)
-        mock_my_participation.assert_called_once()
-        mock_lb.assert_called_once()
+        self.mock_api.get_my_participation.assert_called_once()
+        self.mock_api.get_leaderboard.assert_called_once()
+
+    def test_my_rank_is_cached(self):
+        """Test repeated rank reads reuse the API response until invalidated."""
+        self.mock_api.get_my_participation.return_value = {"public_rank": 2}
+
+        self.assertEqual(self.user.my_rank, 2)
+        self.assertEqual(self.user.my_rank, 2)
+        self.mock_api.get_my_participation.assert_called_once()
+
+        self.user.invalidate_cache()
+        self.assertEqual(self.user.my_rank, 2)
+        self.assertEqual(self.mock_api.get_my_participation.call_count, 2)
+
+    def test_remaining_submissions_is_cached(self):
+        """Test submission limits are cached and refreshed after a submit."""
+        self.mock_api.get_submission_limits.return_value = {"today": 4}
+        self.mock_api.submit_file.return_value = MOCK_SUBMIT_SUCCESS
+
+        self.assertEqual(self.user.remaining_subimissions, 4)
+        self.assertEqual(self.user.remaining_subimissions, 4)
+        self.mock_api.get_submission_limits.assert_called_once()
+
+        self.user.submit(filepaths=["./submission.csv"], to_print=False)
+        self.user.remaining_subimissions
+        self.assertEqual(self.mock_api.get_submission_limits.call_count, 2)
 
     def test_remaining_submissions_not_selected(self):
         """Test remaining submissions before selecting a challenge."""
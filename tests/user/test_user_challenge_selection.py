@@ -1,13 +1,18 @@
+import copy
 import unittest
-from unittest.mock import patch
+from types import MappingProxyType
+from unittest.mock import create_autospec, patch
 
+from zindi.platform_api import ZindiPlatformAPI
 from zindi.user import Zindian
 
 # Mock API responses (Copied from original file)
-MOCK_SIGNIN_SUCCESS = {
-    "auth_token": "mock_token",
-    "user": {"username": "testuser", "id": 123},
-}
+MOCK_SIGNIN_SUCCESS = MappingProxyType(
+    {
+        "auth_token": "mock_token",
+        "user": {"username": "testuser", "id": 123},
+    }
+)
 MOCK_CHALLENGES_DATA = [
     {
         "id": "challenge-1",
@@ -44,16 +49,23 @@ MOCK_CHALLENGES_DATA = [
 
 # --- Base Class for Tests Requiring Authenticated User ---
 class AuthenticatedUserTestCase(unittest.TestCase):
-    @patch("zindi.user.ZindiPlatformAPI.signin")
-    @patch("zindi.user.getpass")
-    def setUp(self, mock_getpass, mock_signin):
-        """Set up a mocked Zindian instance for tests."""
-        mock_getpass.return_value = "password"
-        mock_signin.return_value = MOCK_SIGNIN_SUCCESS
-        self.user = Zindian(username="testuser")
-        # Prevent setUp mocks from interfering with test-specific mocks
-        mock_getpass.reset_mock()
-        mock_signin.reset_mock()
+    @classmethod
+    def setUpClass(cls):
+        """Sign in a mocked Zindian once, shared as a template by all tests."""
+        with (
+            patch("zindi.user.ZindiPlatformAPI.signin") as mock_signin,
+            patch("zindi.user.getpass") as mock_getpass,
+        ):
+            mock_getpass.return_value = "password"
+            mock_signin.return_value = MOCK_SIGNIN_SUCCESS
+            cls._template_user = Zindian(username="testuser")
+
+    def setUp(self):
+        """Give each test its own copy of the signed-in template."""
+        self.user = copy.copy(self._template_user)
+        self.user.invalidate_cache()  # copies must not share the template's cache
+        self.mock_api = create_autospec(ZindiPlatformAPI, instance=True, spec_set=True)
+        self.user._Zindian__api_client = self.mock_api
 
 
 # --- Test Class for Challenge Selection ---
@@ -62,28 +74,30 @@ class TestUserChallengeSelection(AuthenticatedUserTestCase):
         """Test which_challenge when no challenge is selected."""
         self.assertIsNone(self.user.which_challenge)
 
-    @patch("zindi.user.ZindiPlatformAPI.join_competition")
-    @patch("zindi.user.ZindiPlatformAPI.search_competitions")
     @patch("builtins.input", return_value="1")
-    def test_select_a_challenge_success(self, mock_input, mock_search, mock_join):
+    def test_select_a_challenge_success(self, mock_input):
         """Test successfully selecting a challenge via input."""
-        mock_search.return_value = MOCK_CHALLENGES_DATA
-        mock_join.return_value = {"joined": True, "message": "already in"}
+        self.mock_api.search_competitions.return_value = MOCK_CHALLENGES_DATA
+        self.mock_api.join_competition.return_value = {
+            "joined": True,
+            "message": "already in",
+        }
 
         self.user.select_a_challenge(kind="all")
 
-        mock_search.assert_called_once()
-        mock_join.assert_called_once()
+        self.mock_api.search_competitions.assert_called_once()
+        self.mock_api.join_competition.assert_called_once()
         self.assertTrue(self.user._Zindian__challenge_selected)
         self.assertEqual(self.user._Zindian__challenge_data["id"], "challenge-2")
         self.assertEqual(self.user.which_challenge, "challenge-2")
 
-    @patch("zindi.user.ZindiPlatformAPI.join_competition")
-    @patch("zindi.user.ZindiPlatformAPI.search_competitions")
-    def test_select_a_challenge_fixed_index(self, mock_search, mock_join):
+    def test_select_a_challenge_fixed_index(self):
         """Test selecting a challenge using fixed_index."""
-        mock_search.return_value = MOCK_CHALLENGES_DATA
-        mock_join.return_value = {"joined": True, "message": "already in"}
+        self.mock_api.search_competitions.return_value = MOCK_CHALLENGES_DATA
+        self.mock_api.join_competition.return_value = {
+            "joined": True,
+            "message": "already in",
+        }
 
         response = self.user.select_a_challenge(fixed_index=2)
 
@@ -91,19 +105,16 @@ class TestUserChallengeSelection(AuthenticatedUserTestCase):
         self.assertEqual(self.user._Zindian__challenge_data["id"], "challenge-3")
         self.assertEqual(response["challenge"]["id"], "challenge-3")
         self.assertTrue(response["joined"]["joined"])
-        mock_join.assert_called_once()
+        self.mock_api.join_competition.assert_called_once()
 
-    @patch("zindi.user.ZindiPlatformAPI.search_competitions")
-    def test_select_a_challenge_invalid_fixed_index(self, mock_search):
+    def test_select_a_challenge_invalid_fixed_index(self):
         """Test selecting a challenge with an invalid fixed_index."""
-        mock_search.return_value = MOCK_CHALLENGES_DATA
-        with self.assertRaises(Exception) as cm:
-            self.user.select_a_challenge(fixed_index=10)
-        self.assertIn("must be an integer in range", str(cm.exception))
-
-        with self.assertRaises(Exception) as cm:
-            self.user.select_a_challenge(fixed_index=-1)
-        self.assertIn("must be an integer in range", str(cm.exception))
+        self.mock_api.search_competitions.return_value = MOCK_CHALLENGES_DATA
+        for fixed_index in (10, -1):
+            with self.subTest(fixed_index=fixed_index):
+                with self.assertRaises(Exception) as cm:
+                    self.user.select_a_challenge(fixed_index=fixed_index)
+                self.assertIn("must be an integer in range", str(cm.exception))
 
 
 if __name__ == "__main__":
@@ -1,36 +1,57 @@
+import copy
 import unittest
-from unittest.mock import call, patch
-
-import pandas as pd
+from types import MappingProxyType
+from unittest.mock import call, create_autospec, patch
 
+from zindi.platform_api import ZindiAPIError, ZindiPlatformAPI
 from zindi.user import Zindian
 
 # Mock API responses (Copied from original file)
-MOCK_SIGNIN_SUCCESS = {
-    "auth_token": "mock_token",
-    "user": {"username": "testuser", "id": 123},
-}
-MOCK_CREATE_TEAM_SUCCESS = {"title": "New Team"}
-MOCK_CREATE_TEAM_ALREADY_LEADER = {
-    "errors": {"base": "Leader can only be part of one team per competition."}
-}
-MOCK_TEAM_UP_SUCCESS = {"message": "Invitation sent"}
-MOCK_TEAM_UP_ALREADY_INVITED = {"errors": {"base": "User is already invited"}}
+MOCK_SIGNIN_SUCCESS = MappingProxyType(
+    {
+        "auth_token": "mock_token",
+        "user": {"username": "testuser", "id": 123},
+    }
+)
+MOCK_CREATE_TEAM_SUCCESS = MappingProxyType({"title": "New Team"})
+MOCK_CREATE_TEAM_ALREADY_LEADER = MappingProxyType(
+    {"errors": {"base": "Leader can only be part of one team per competition."}}
+)
+MOCK_TEAM_UP_SUCCESS = MappingProxyType({"message": "Invitation sent"})
+MOCK_TEAM_UP_ALREADY_INVITED = MappingProxyType(
+    {"errors": {"base": "User is already invited"}}
+)
+MOCK_TEAM_ERROR = MappingProxyType({"errors": {"base": "Team is full"}})
 MOCK_DISBAND_SUCCESS = "Team disbanded successfully"
+EXPECTED_AUTH = MappingProxyType(
+    {"auth_token": "mock_token", "challenge_id": "challenge-team"}
+)
+MOCK_SELECTED_CHALLENGE = MappingProxyType(
+    {"id": "challenge-team", "subtitle": "Team Challenge"}
+)
+TEAM_INVITE_F1 = call(**EXPECTED_AUTH, username="friend1")
+TEAM_INVITE_F2 = call(**EXPECTED_AUTH, username="friend2")
 
 
 # --- Base Class for Tests Requiring Authenticated User ---
 class AuthenticatedUserTestCase(unittest.TestCase):
-    @patch("zindi.user.ZindiPlatformAPI.signin")
-    @patch("zindi.user.getpass")
-    def setUp(self, mock_getpass, mock_signin):
-        """Set up a mocked Zindian instance for tests."""
-        mock_getpass.return_value = "password"
-        mock_signin.return_value = MOCK_SIGNIN_SUCCESS
-        self.user = Zindian(username="testuser")
-        # Prevent setUp mocks from interfering with test-specific mocks
-        mock_getpass.reset_mock()
-        mock_signin.reset_mock()
+    @classmethod
+    def setUpClass(cls):
+        """Sign in a mocked Zindian once, shared as a template by all tests."""
+        with (
+            patch("zindi.user.ZindiPlatformAPI.signin") as mock_signin,
+            patch("zindi.user.getpass") as mock_getpass,
+        ):
+            mock_getpass.return_value = "password"
+            mock_signin.return_value = MOCK_SIGNIN_SUCCESS
+            cls._template_user = Zindian(username="testuser")
+
+    def setUp(self):
+        """Give each test its own copy of the signed-in template."""
+        self.user = copy.copy(self._template_user)
+        self.user.invalidate_cache()  # copies must not share the template's cache
+        self.mock_api = create_autospec(ZindiPlatformAPI, instance=True, spec_set=True)
+        self.user._Zindian__api_client = self.mock_api
 
 
 # --- Test Class for Team Management ---
@@ -40,9 +61,7 @@ class TestUserTeamManagement(AuthenticatedUserTestCase):
         super().setUp()
         # Pre-select a challenge for these tests
         self.user._Zindian__challenge_selected = True
-        self.user._Zindian__challenge_data = pd.Series(
-            {"id": "challenge-team", "subtitle": "Team Challenge"}
-        )
+        self.user._Zindian__challenge_data = MOCK_SELECTED_CHALLENGE
         self.user._Zindian__api = f"{self.user._Zindian__base_api}/challenge-team"
 
     def test_team_action_not_selected_error(self):
@@ -60,63 +79,64 @@ class TestUserTeamManagement(AuthenticatedUserTestCase):
             self.user.disband_team()
         self.assertIn("select a challenge before", str(cm_disband.exception))
 
-    @patch("zindi.user.ZindiPlatformAPI.create_team")
-    def test_create_team_success(self, mock_create_team):
+    def test_create_team_success(self):
         """Test creating a team successfully."""
-        mock_create_team.return_value = MOCK_CREATE_TEAM_SUCCESS
+        self.mock_api.create_team.return_value = MOCK_CREATE_TEAM_SUCCESS
         response = self.user.create_team(team_name="New Team")
-        mock_create_team.assert_called_once_with(
-            auth_token="mock_token",
-            challenge_id="challenge-team",
+        self.mock_api.create_team.assert_called_once_with(
+            **EXPECTED_AUTH,
             team_name="New Team",
         )
         self.assertFalse(response["already_leader"])
         self.assertEqual(response["team"]["title"], "New Team")
 
-    @patch("zindi.user.ZindiPlatformAPI.create_team")
     @patch("builtins.print")  # Mock print
-    def test_create_team_already_leader(self, mock_print, mock_create_team):
+    def test_create_team_already_leader(self, mock_print):
         """Test creating a team when already a leader."""
-        mock_create_team.return_value = MOCK_CREATE_TEAM_ALREADY_LEADER
+        self.mock_api.create_team.return_value = MOCK_CREATE_TEAM_ALREADY_LEADER
         self.user.create_team(team_name="Another Team")
-        mock_create_team.assert_called_once()
+        self.mock_api.create_team.assert_called_once()
         mock_print.assert_any_call(f"\n[ 🟢 ] You are already the leader of a team.\n")
 
-    @patch("zindi.user.ZindiPlatformAPI.invite_to_team")
-    def test_team_up_success(self, mock_invite):
+    def test_team_up_success(self):
         """Test inviting teammates successfully."""
-        mock_invite.return_value = MOCK_TEAM_UP_SUCCESS
+        self.mock_api.invite_to_team.return_value = MOCK_TEAM_UP_SUCCESS
         teammates = ["friend1", "friend2"]
         response = self.user.team_up(zindians=teammates)
 
-        self.assertEqual(mock_invite.call_count, 2)
-        expected_calls = [
-            call(
-                auth_token="mock_token",
-                challenge_id="challenge-team",
-                username="friend1",
-            ),
-            call(
-                auth_token="mock_token",
-                challenge_id="challenge-team",
-                username="friend2",
-            ),
-        ]
-        mock_invite.assert_has_calls(expected_calls, any_order=True)
-        self.assertEqual(len(response), 2)
+        # Invitations are sent concurrently, so only the set of calls is fixed
+        self.assertCountEqual(
+            self.mock_api.invite_to_team.call_args_list,
+            [TEAM_INVITE_F1, TEAM_INVITE_F2],
+        )
+        self.assertEqual([invite["username"] for invite in response], teammates)
         self.assertEqual(response[0]["status"], "invited")
 
-    @patch("zindi.user.ZindiPlatformAPI.disband_team")
-    def test_disband_team_success(self, mock_disband):
+    def test_disband_team_success(self):
         """Test disbanding a team successfully."""
-        mock_disband.return_value = MOCK_DISBAND_SUCCESS
+        self.mock_api.disband_team.return_value = MOCK_DISBAND_SUCCESS
         response = self.user.disband_team()
-        mock_disband.assert_called_once_with(
-            auth_token="mock_token",
-            challenge_id="challenge-team",
+        self.mock_api.disband_team.assert_called_once_with(
+            **EXPECTED_AUTH,
         )
         self.assertEqual(response, "Team disbanded successfully")
 
+    def test_team_api_errors_raise_typed_error(self):
+        """Test API error payloads from team actions raise ZindiAPIError."""
+        self.mock_api.create_team.return_value = MOCK_TEAM_ERROR
+        self.mock_api.invite_to_team.return_value = MOCK_TEAM_ERROR
+        self.mock_api.disband_team.return_value = MOCK_TEAM_ERROR
+        actions = {
+            "create_team": lambda: self.user.create_team(team_name="Full"),
+            "team_up": lambda: self.user.team_up(zindians=["friend1"]),
+            "disband_team": self.user.disband_team,
+        }
+        for name, action in actions.items():
+            with self.subTest(action=name):
+                with self.assertRaises(ZindiAPIError) as cm:
+                    action()
+                self.assertIn("Team is full", str(cm.exception))
+
 
 if __name__ == "__main__":
     unittest.main()
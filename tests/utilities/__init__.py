@@ -0,0 +1,11 @@
+import unittest
+from unittest.mock import patch
+
+
+class PatchingTestCase(unittest.TestCase):
+    """TestCase that starts patches in ``setUp`` and stops them on cleanup."""
+
+    def _start_patch(self, target, **kwargs):
+        patcher = patch(target, **kwargs)
+        self.addCleanup(patcher.stop)
+        return patcher.start()
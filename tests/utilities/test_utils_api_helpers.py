@@ -1,48 +1,64 @@
 import unittest
-from unittest.mock import MagicMock, patch
-
-import pandas as pd
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import call, patch
 
+from tests.utilities import PatchingTestCase
 from zindi import utils
 
 # Sample data needed for API helper tests
-SAMPLE_CHALLENGES_DATA = pd.DataFrame(
-    [
-        {
-            "id": "challenge-1-long-id-string-that-needs-truncating",
-            "kind": "competition",
-            "subtitle": "Challenge 1 Subtitle",
-            "reward": "prize",
-            "type_of_problem": ["Classification"],
-            "data_type": ["Tabular"],
-            "secret_code_required": False,
-            "sealed": False,
-        },
-        {
-            "id": "challenge-2",
-            "kind": "hackathon",
-            "subtitle": "Challenge 2 Subtitle",
-            "reward": "points",
-            "type_of_problem": [],  # Empty problem type
-            "data_type": ["Image"],
-            "secret_code_required": True,  # Private
-            "sealed": False,
-        },
-    ]
+_AUTH_HEADERS = MappingProxyType({"auth-token": "token"})
+_CHALLENGE_COLUMNS = (
+    "id",
+    "kind",
+    "subtitle",
+    "reward",
+    "type_of_problem",
+    "data_type",
+    "secret_code_required",
+    "sealed",
+)
+_CHALLENGE_ROWS = (
+    (
+        "challenge-1-long-id-string-that-needs-truncating",
+        "competition",
+        "Challenge 1 Subtitle",
+        "prize",
+        ["Classification"],
+        ["Tabular"],
+        False,
+        False,
+    ),
+    (
+        "challenge-2",
+        "hackathon",
+        "Challenge 2 Subtitle",
+        "points",
+        [],  # Empty problem type
+        ["Image"],
+        True,  # Private
+        False,
+    ),
+)
+SAMPLE_CHALLENGES_RECORDS = tuple(
+    dict(zip(_CHALLENGE_COLUMNS, row)) for row in _CHALLENGE_ROWS
 )
 
 
 # --- Test Class for API Helper Functions (join_challenge, get_challenges) ---
-class TestApiHelpers(unittest.TestCase):
-    @patch("zindi.utils.requests.post")
+class TestApiHelpers(PatchingTestCase):
+    def setUp(self):
+        """Patch the HTTP verbs used by the API helpers."""
+        self.mock_get = self._start_patch("zindi.utils.requests.get")
+        self.mock_post = self._start_patch("zindi.utils.requests.post")
+
     @patch("builtins.print")
-    def test_join_challenge_success(self, mock_print, mock_post):
+    def test_join_challenge_success(self, mock_print):
         """Test joining a challenge successfully."""
-        mock_post.return_value.json.return_value = {"data": {"ids": [123]}}
-        headers = {"auth-token": "token"}
+        self.mock_post.return_value.json.return_value = {"data": {"ids": [123]}}
+        headers = _AUTH_HEADERS
         url = "http://example.com/participations"
         utils.join_challenge(url=url, headers=headers)
-        mock_post.assert_called_once_with(
+        self.mock_post.assert_called_once_with(
             url=url,
             headers=headers,
         )
@@ -50,30 +66,28 @@ class TestApiHelpers(unittest.TestCase):
             "\n[ 🟢 ] Welcome for the first time to this challenge.\n"
         )
 
-    @patch("zindi.utils.requests.post")
     @patch("builtins.print")
-    def test_join_challenge_already_in(self, mock_print, mock_post):
+    def test_join_challenge_already_in(self, mock_print):
         """Test joining a challenge when already participating."""
-        mock_post.return_value.json.return_value = {
+        self.mock_post.return_value.json.return_value = {
             "data": {"errors": {"message": "already in"}}
         }
-        headers = {"auth-token": "token"}
+        headers = _AUTH_HEADERS
         url = "http://example.com/participations"
         utils.join_challenge(url=url, headers=headers)
-        mock_post.assert_called_once_with(
+        self.mock_post.assert_called_once_with(
             url=url,
             headers=headers,
         )
         # Should not print success or raise error
 
-    @patch("zindi.utils.requests.post")
     @patch("builtins.input", return_value="secretcode123")
     @patch("builtins.print")
-    def test_join_challenge_requires_code(self, mock_print, mock_input, mock_post):
+    def test_join_challenge_requires_code(self, mock_print, mock_input):
         """Test joining a challenge that requires a secret code."""
         # First call response indicates code needed, second call response is success
-        mock_post.side_effect = [
-            MagicMock(
+        self.mock_post.side_effect = [
+            SimpleNamespace(
                 json=lambda: {
                     "data": {
                         "errors": {
@@ -82,47 +96,42 @@ class TestApiHelpers(unittest.TestCase):
                     }
                 }
             ),
-            MagicMock(json=lambda: {"data": {"ids": [456]}}),
+            SimpleNamespace(json=lambda: {"data": {"ids": [456]}}),
         ]
-        headers = {"auth-token": "token"}
+        headers = _AUTH_HEADERS
         url = "http://example.com/participations"
 
         utils.join_challenge(url=url, headers=headers)
 
-        self.assertEqual(mock_post.call_count, 2)
-        # First call (no code)
-        mock_post.assert_any_call(
-            url=url,
-            headers=headers,
-        )
-        # Second call (with code)
-        mock_post.assert_any_call(
-            url=url, headers=headers, params={"secret_code": "secretcode123"}
-        )
+        expected_calls = [
+            call(url=url, headers=headers),  # First call (no code)
+            call(  # Second call (with code)
+                url=url, headers=headers, params={"secret_code": "secretcode123"}
+            ),
+        ]
+        self.assertEqual(self.mock_post.call_args_list, expected_calls)
         mock_input.assert_called_once()
         mock_print.assert_any_call(
             "\n[ 🟢 ] Welcome for the first time to this challenge.\n"
         )
 
-    @patch("zindi.utils.requests.post")
-    def test_join_challenge_other_error(self, mock_post):
+    def test_join_challenge_other_error(self):
         """Test joining a challenge with an unexpected error."""
-        mock_post.return_value.json.return_value = {
+        self.mock_post.return_value.json.return_value = {
             "data": {"errors": {"message": "Some other error"}}
         }
-        headers = {"auth-token": "token"}
+        headers = _AUTH_HEADERS
         url = "http://example.com/participations"
         with self.assertRaises(Exception) as cm:
             utils.join_challenge(url=url, headers=headers)
         self.assertIn("Some other error", str(cm.exception))
-        mock_post.assert_called_once()
+        self.mock_post.assert_called_once()
 
-    @patch("zindi.utils.requests.get")
-    def test_get_challenges_success(self, mock_get):
+    def test_get_challenges_success(self):
         """Test getting challenges successfully with filters."""
-        mock_get.return_value.json.return_value = {
-            "data": SAMPLE_CHALLENGES_DATA.to_dict("records")
-        }
+        self.mock_get.return_value = SimpleNamespace(
+            json=lambda: {"data": SAMPLE_CHALLENGES_RECORDS}
+        )
         headers = {"User-Agent": "Test"}
         url = "http://base.api/competitions"
 
@@ -137,15 +146,16 @@ class TestApiHelpers(unittest.TestCase):
             "kind[]": "competition",
             "active": "true",
         }
-        mock_get.assert_called_once_with(url, headers=headers, params=expected_params)
-        pd.testing.assert_frame_equal(df, SAMPLE_CHALLENGES_DATA)
+        self.mock_get.assert_called_once_with(
+            url, headers=headers, params=expected_params
+        )
+        self.assertEqual(tuple(df.to_dict("records")), SAMPLE_CHALLENGES_RECORDS)
 
-    @patch("zindi.utils.requests.get")
-    def test_get_challenges_invalid_filters(self, mock_get):
+    def test_get_challenges_invalid_filters(self):
         """Test getting challenges with invalid filter values (should default)."""
-        mock_get.return_value.json.return_value = {
-            "data": SAMPLE_CHALLENGES_DATA.to_dict("records")
-        }
+        self.mock_get.return_value = SimpleNamespace(
+            json=lambda: {"data": SAMPLE_CHALLENGES_RECORDS}
+        )
         headers = {"User-Agent": "Test"}
         url = "http://base.api/competitions"
 
@@ -164,7 +174,9 @@ class TestApiHelpers(unittest.TestCase):
             "kind[]": "competition",
             "active": "",
         }
-        mock_get.assert_called_once_with(url, headers=headers, params=expected_params)
+        self.mock_get.assert_called_once_with(
+            url, headers=headers, params=expected_params
+        )
 
 
 if __name__ == "__main__":
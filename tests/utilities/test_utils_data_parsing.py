@@ -1,10 +1,15 @@
 import unittest
-from unittest.mock import patch
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import call, patch
 
+from tests.utilities import PatchingTestCase
 from zindi import utils
 
 # Sample data needed for data parsing tests
-SAMPLE_LEADERBOARD_DATA = [
+# Fixtures are immutable so tests can never leak state into each other.
+_AUTH_HEADERS = MappingProxyType({"auth_token": "token"})
+
+SAMPLE_LEADERBOARD_DATA = (
     {
         "public_rank": 1,
         "best_public_score": 0.95,
@@ -40,53 +45,70 @@ SAMPLE_LEADERBOARD_DATA = [
         "submission_count": 0,
         "best_public_submitted_at": None,
     },
-]
+)
 
-SAMPLE_PARTICIPATIONS_RESPONSE = {
-    "data": {
-        "challenge-1": {"team_id": None},
-        "challenge-2": {"team_id": "team-abc"},
+SAMPLE_PARTICIPATIONS_RESPONSE = MappingProxyType(
+    {
+        "data": {
+            "challenge-1": {"team_id": None},
+            "challenge-2": {"team_id": "team-abc"},
+        }
     }
-}
-
-SAMPLE_CHALLENGE_RULES_PAGE = {
-    "data": {
-        "pages": [
-            {"title": "Overview", "content_html": "Some content"},
-            {
-                "title": "Rules",
-                "content_html": "Blah blah You may make a maximum of 7 submissions per day. Blah blah",
-            },
-        ]
+)
+
+SAMPLE_CHALLENGE_RULES_PAGE = MappingProxyType(
+    {
+        "data": {
+            "pages": [
+                {"title": "Overview", "content_html": "Some content"},
+                {
+                    "title": "Rules",
+                    "content_html": "Blah blah You may make a maximum of 7 submissions per day. Blah blah",
+                },
+            ]
+        }
     }
-}
+)
 
-SAMPLE_CHALLENGE_NO_RULES_PAGE = {
-    "data": {
-        "pages": [
-            {"title": "Overview", "content_html": "Some content"},
-            {"title": "Data", "content_html": "Data details"},
-        ]
+SAMPLE_CHALLENGE_NO_RULES_PAGE = MappingProxyType(
+    {
+        "data": {
+            "pages": [
+                {"title": "Overview", "content_html": "Some content"},
+                {"title": "Data", "content_html": "Data details"},
+            ]
+        }
     }
-}
+)
 
-SAMPLE_CHALLENGE_MALFORMED_RULES = {
-    "data": {
-        "pages": [
-            {"title": "Rules", "content_html": "Submit whenever you want."},
-        ]
+SAMPLE_CHALLENGE_MALFORMED_RULES = MappingProxyType(
+    {
+        "data": {
+            "pages": [
+                {"title": "Rules", "content_html": "Submit whenever you want."},
+            ]
+        }
     }
-}
+)
+
+
+def _response(payload):
+    """Build a minimal successful HTTP response returning ``payload``."""
+    return SimpleNamespace(json=lambda: payload, raise_for_status=lambda: None)
 
 
 # --- Test Class for Data Parsing/Retrieval Functions ---
-class TestDataParsing(unittest.TestCase):
-    @patch("zindi.utils.requests.get")
-    def test_participations_found(self, mock_get):
+class TestDataParsing(PatchingTestCase):
+    def setUp(self):
+        """Patch the HTTP GET used to look up participations."""
+        self.mock_get = self._start_patch("zindi.utils.requests.get")
+
+    def test_participations_found(self):
         """Test participations check when user is participating."""
-        mock_get.return_value.json.return_value = SAMPLE_PARTICIPATIONS_RESPONSE
-        mock_get.return_value.raise_for_status.return_value = None
-        headers = {"auth_token": "token"}
+        self.mock_get.side_effect = [
+            _response(SAMPLE_PARTICIPATIONS_RESPONSE) for _ in range(2)
+        ]
+        headers = _AUTH_HEADERS
 
         team_id_none = utils.participations("challenge-1", headers)
         self.assertIsNone(team_id_none)
@@ -94,17 +116,15 @@ class TestDataParsing(unittest.TestCase):
         team_id_exists = utils.participations("challenge-2", headers)
         self.assertEqual(team_id_exists, "team-abc")
 
-        self.assertEqual(mock_get.call_count, 2)
-        mock_get.assert_called_with(
+        expected_call = call(
             "https://api.zindi.africa/v1/participations", headers=headers
         )
+        self.assertEqual(self.mock_get.call_args_list, [expected_call] * 2)
 
-    @patch("zindi.utils.requests.get")
-    def test_participations_not_found(self, mock_get):
+    def test_participations_not_found(self):
         """Test participations check when challenge ID is not in response."""
-        mock_get.return_value.json.return_value = SAMPLE_PARTICIPATIONS_RESPONSE
-        mock_get.return_value.raise_for_status.return_value = None
-        headers = {"auth_token": "token"}
+        self.mock_get.return_value = _response(SAMPLE_PARTICIPATIONS_RESPONSE)
+        headers = _AUTH_HEADERS
 
         with self.assertRaises(KeyError):  # Expect KeyError if challenge_id is missing
             utils.participations("challenge-missing", headers)
@@ -113,7 +133,7 @@ class TestDataParsing(unittest.TestCase):
     def test_user_on_lb_direct_user(self, mock_participations):
         """Test finding user rank directly."""
         mock_participations.return_value = None  # User is not in a team
-        headers = {"auth_token": "token"}
+        headers = _AUTH_HEADERS
         rank = utils.user_on_lb(
             SAMPLE_LEADERBOARD_DATA, "challenge-id", "testuser", headers
         )
@@ -126,7 +146,7 @@ class TestDataParsing(unittest.TestCase):
     def test_user_on_lb_team_user(self, mock_participations):
         """Test finding user rank via team."""
         mock_participations.return_value = "team-123"  # User is in this team
-        headers = {"auth_token": "token"}
+        headers = _AUTH_HEADERS
         rank = utils.user_on_lb(
             SAMPLE_LEADERBOARD_DATA, "challenge-id", "anyuser_in_team", headers
         )
@@ -139,7 +159,7 @@ class TestDataParsing(unittest.TestCase):
     def test_user_on_lb_not_found(self, mock_participations):
         """Test when user is not found on the leaderboard."""
         mock_participations.return_value = None
-        headers = {"auth_token": "token"}
+        headers = _AUTH_HEADERS
         rank = utils.user_on_lb(
             SAMPLE_LEADERBOARD_DATA, "challenge-id", "nonexistentuser", headers
         )
@@ -1,29 +1,51 @@
+import io
 import unittest
-from unittest.mock import MagicMock, call, mock_open, patch
+from unittest.mock import DEFAULT, MagicMock, Mock, call, patch
 
-import requests  # Import requests for exception testing
+from requests.exceptions import RequestException
 
+from tests.utilities import PatchingTestCase
 from zindi import utils
 
 
+def _streaming_response(status_code, *chunks, content_length=None, **headers):
+    """Build a context-managed streamed response yielding ``chunks``.
+
+    Extra keyword arguments become response headers, with ``_`` spelled ``-``.
+    """
+    if content_length is None:
+        content_length = sum(map(len, chunks))
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.status_code = status_code
+    response.headers = {
+        "content-length": str(content_length),
+        **{name.replace("_", "-"): value for name, value in headers.items()},
+    }
+    response.iter_content.side_effect = lambda chunk_size=None: iter(chunks)
+    return response
+
+
 # --- Test Class for File Operations (Download, Upload) ---
-class TestFileOperations(unittest.TestCase):
-    @patch("zindi.utils.requests.get")
-    @patch("zindi.utils.open", new_callable=mock_open)
-    @patch("zindi.utils.tqdm")
-    def test_download_success(self, mock_tqdm, mock_open_func, mock_get):
+class TestFileOperations(PatchingTestCase):
+    def setUp(self):
+        """Patch the network, file and progress-bar helpers used by utils."""
+        self.mock_get = self._start_patch("zindi.utils.requests.get")
+        self.mock_post = self._start_patch("zindi.utils.requests.post")
+        self.mock_open_func = self._start_patch("zindi.utils.open")
+        self.mock_tqdm = self._start_patch("zindi.utils.tqdm")
+
+    def test_download_success(self):
         """Test successful file download."""
-        mock_response = MagicMock()
-        mock_response.raise_for_status.return_value = None
-        mock_response.headers.get.return_value = "10240"  # content-length
-        mock_response.iter_content.return_value = [b"chunk1", b"chunk2"]
-        mock_get.return_value = mock_response
+        mock_response = _streaming_response(200, b"chunk1", b"chunk2")
+        self.mock_get.return_value = mock_response
 
-        mock_bar = MagicMock()
-        mock_tqdm.return_value.__enter__.return_value = mock_bar
+        mock_bar = Mock()
+        self.mock_tqdm.return_value.__enter__.return_value = mock_bar
 
-        mock_file_handle = mock_open_func.return_value.__enter__.return_value
-        mock_file_handle.write.side_effect = [len(b"chunk1"), len(b"chunk2")]
+        # A real in-memory file collects the written chunks
+        written = io.BytesIO()
+        self.mock_open_func.return_value.__enter__.return_value = written
 
         url = "http://example.com/file.csv"
         filename = "local_file.csv"
@@ -31,58 +53,172 @@ class TestFileOperations(unittest.TestCase):
 
         utils.download(url=url, filename=filename, headers=headers)
 
-        mock_get.assert_called_once_with(
+        self.mock_get.assert_called_once_with(
             url, headers=headers, data={"auth_token": "test_token"}, stream=True
         )
         mock_response.raise_for_status.assert_called_once()
-        mock_open_func.assert_called_once_with(filename, "wb")
-        mock_tqdm.assert_called_once_with(
-            desc=filename, total=10240, unit="o", unit_scale=True, unit_divisor=1024
+        mock_response.iter_content.assert_called_once_with(
+            chunk_size=utils.DOWNLOAD_CHUNK_SIZE
         )
-        self.assertEqual(mock_file_handle.write.call_count, 2)
-        mock_file_handle.write.assert_has_calls([call(b"chunk1"), call(b"chunk2")])
+        self.mock_open_func.assert_called_once_with(filename, "wb")
+        self.mock_tqdm.assert_called_once_with(
+            desc=filename,
+            total=12,
+            initial=0,
+            unit="o",
+            unit_scale=True,
+            unit_divisor=1024,
+        )
+        self.assertEqual(written.getvalue(), b"chunk1chunk2")
         self.assertEqual(mock_bar.update.call_count, 2)
         mock_bar.update.assert_has_calls([call(len(b"chunk1")), call(len(b"chunk2"))])
 
-    @patch("zindi.utils.requests.get")
-    def test_download_error(self, mock_get):
+    @patch("zindi.utils.os.path.getsize", return_value=6)
+    @patch("zindi.utils.os.path.isfile", return_value=True)
+    def test_download_resume(self, mock_isfile, mock_getsize):
+        """Test a partial file is completed with a Range request."""
+        self.mock_get.return_value = _streaming_response(206, b"chunk2")
+        self.mock_open_func.return_value.__enter__.return_value = io.BytesIO()
+        headers = {"auth_token": "test_token"}
+
+        utils.download(
+            url="http://example.com/file.csv",
+            filename="local_file.csv",
+            headers=headers,
+            resume=True,
+        )
+
+        self.assertEqual(
+            self.mock_get.call_args.kwargs["headers"],
+            {**headers, "Range": "bytes=6-", "Accept-Encoding": "identity"},
+        )
+        self.mock_open_func.assert_called_once_with("local_file.csv", "ab")
+        self.assertEqual(self.mock_tqdm.call_args.kwargs["initial"], 6)
+
+    @patch("zindi.utils.os.path.getsize", return_value=12)
+    @patch("zindi.utils.os.path.isfile", return_value=True)
+    def test_download_resume_already_complete(self, mock_isfile, mock_getsize):
+        """Test a complete local file is left untouched on resume."""
+        self.mock_get.return_value = _streaming_response(
+            416, content_range="bytes */12"
+        )
+
+        utils.download(
+            url="http://example.com/file.csv",
+            filename="local_file.csv",
+            headers={},
+            resume=True,
+        )
+
+        self.mock_get.assert_called_once()
+        self.mock_open_func.assert_not_called()
+
+    @patch("zindi.utils.os.path.getsize", return_value=12)
+    @patch("zindi.utils.os.path.isfile", return_value=True)
+    def test_download_resume_size_mismatch(self, mock_isfile, mock_getsize):
+        """Test a local file of another size is downloaded again on 416."""
+        self.mock_get.side_effect = [
+            _streaming_response(416, content_range="bytes */20"),
+            _streaming_response(200, b"chunk1", b"chunk2", b"chunk3"),
+        ]
+        written = io.BytesIO()
+        self.mock_open_func.return_value.__enter__.return_value = written
+        headers = {"auth_token": "test_token"}
+
+        utils.download(
+            url="http://example.com/file.csv",
+            filename="local_file.csv",
+            headers=headers,
+            resume=True,
+        )
+
+        self.assertEqual(self.mock_get.call_args.kwargs["headers"], headers)
+        self.mock_open_func.assert_called_once_with("local_file.csv", "wb")
+        self.assertEqual(written.getvalue(), b"chunk1chunk2chunk3")
+
+    @patch("zindi.utils.os.path.getsize", return_value=6)
+    @patch("zindi.utils.os.path.isfile", return_value=True)
+    def test_download_resume_encoded_body(self, mock_isfile, mock_getsize):
+        """Test an encoded partial body is not appended to the decoded file."""
+        self.mock_get.side_effect = [
+            _streaming_response(206, b"gzip-bytes", content_encoding="gzip"),
+            _streaming_response(200, b"chunk1chunk2", content_encoding="gzip"),
+        ]
+        written = io.BytesIO()
+        self.mock_open_func.return_value.__enter__.return_value = written
+
+        utils.download(
+            url="http://example.com/file.csv",
+            filename="local_file.csv",
+            headers={},
+            resume=True,
+        )
+
+        self.assertEqual(self.mock_get.call_count, 2)
+        self.assertNotIn("Range", self.mock_get.call_args.kwargs["headers"])
+        self.mock_open_func.assert_called_once_with("local_file.csv", "wb")
+        self.assertEqual(written.getvalue(), b"chunk1chunk2")
+
+    def test_download_encoded_body_size(self):
+        """Test a decoded body longer than its compressed length is accepted."""
+        self.mock_get.return_value = _streaming_response(
+            200, b"chunk1chunk2", content_length=8, content_encoding="gzip"
+        )
+        written = io.BytesIO()
+        self.mock_open_func.return_value.__enter__.return_value = written
+
+        utils.download(url="http://example.com/file.csv", filename="local_file.csv")
+
+        self.assertEqual(written.getvalue(), b"chunk1chunk2")
+
+    def test_download_incomplete(self):
+        """Test a truncated body is reported instead of kept silently."""
+        self.mock_get.return_value = _streaming_response(
+            200, b"chunk1", content_length=12
+        )
+        self.mock_open_func.return_value.__enter__.return_value = io.BytesIO()
+
+        with self.assertRaises(Exception) as cm:
+            utils.download(url="http://example.com/file.csv", filename="local_file.csv")
+        self.assertIn("received 6 of 12 bytes", str(cm.exception))
+
+    def test_download_error(self):
         """Test download with a request error."""
         mock_response = MagicMock()
-        # Use requests.exceptions.RequestException directly
-        mock_response.raise_for_status.side_effect = (
-            requests.exceptions.RequestException("Error")
-        )
-        mock_get.return_value = mock_response
+        mock_response.__enter__.return_value = mock_response
+        mock_response.raise_for_status.side_effect = RequestException("Error")
+        self.mock_get.return_value = mock_response
 
-        with self.assertRaises(requests.exceptions.RequestException):
+        with self.assertRaises(RequestException):
             # Pass a dict to headers, even if empty, due to type hint
             utils.download(url="http://badurl.com/file", filename="bad.csv", headers={})
-        mock_get.assert_called_once()
+        self.mock_get.assert_called_once()
         mock_response.raise_for_status.assert_called_once()
 
-    @patch("zindi.utils.requests.post")
-    @patch("zindi.utils.open", new_callable=mock_open, read_data=b"file content")
-    @patch("zindi.utils.tqdm")
-    @patch("zindi.utils.MultipartEncoder")
-    @patch("zindi.utils.MultipartEncoderMonitor")
+    @patch.multiple(
+        "zindi.utils", MultipartEncoder=DEFAULT, MultipartEncoderMonitor=DEFAULT
+    )
     @patch("zindi.utils.os.sep", "/")  # Mock os separator for consistency
-    def test_upload_success(
-        self, mock_monitor, mock_encoder, mock_tqdm, mock_open_func, mock_post
-    ):
+    def test_upload_success(self, **mocks):
         """Test successful file upload."""
-        mock_encoder_instance = MagicMock()
+        mock_encoder = mocks["MultipartEncoder"]
+        mock_monitor = mocks["MultipartEncoderMonitor"]
+        mock_encoder_instance = Mock()
         mock_encoder_instance.len = 5000
         mock_encoder.return_value = mock_encoder_instance
 
-        mock_monitor_instance = MagicMock()
+        mock_monitor_instance = Mock()
         mock_monitor_instance.content_type = "mock/content-type"
         mock_monitor.return_value = mock_monitor_instance
 
-        mock_response = MagicMock()
-        mock_post.return_value = mock_response
+        mock_response = Mock()
+        self.mock_post.return_value = mock_response
 
-        mock_bar = MagicMock()
-        mock_tqdm.return_value.__enter__.return_value = mock_bar
+        mock_bar = Mock()
+        self.mock_tqdm.return_value.__enter__.return_value = mock_bar
+
+        submission_file = io.BytesIO(b"file content")
+        self.mock_open_func.return_value = submission_file
 
         filepath = "/path/to/submission.csv"
         comment = "My submission"
@@ -93,17 +229,18 @@ class TestFileOperations(unittest.TestCase):
             filepath=filepath, comment=comment, url=url, headers=headers
         )
 
-        mock_open_func.assert_called_once_with(filepath, "rb")
+        self.mock_open_func.assert_called_once_with(filepath, "rb")
         mock_encoder.assert_called_once()
         # Check that the file tuple was passed correctly to MultipartEncoder
         (args,), kwargs = mock_encoder.call_args
         self.assertIn("file", args)
         self.assertEqual(args["file"][0], "to/submission.csv")  # Check filename part
+        self.assertIs(args["file"][1], submission_file)
         self.assertEqual(args["file"][2], "text/plain")
         self.assertEqual(args["comment"], comment)
 
         mock_monitor.assert_called_once_with(mock_encoder_instance, unittest.mock.ANY)
-        mock_tqdm.assert_called_once_with(
+        self.mock_tqdm.assert_called_once_with(
             desc="Submit to/submission.csv",
             total=5000,
             ncols=100,
@@ -116,7 +253,7 @@ class TestFileOperations(unittest.TestCase):
             "auth_token": "test_token",
             "Content-Type": "mock/content-type",
         }
-        mock_post.assert_called_once_with(
+        self.mock_post.assert_called_once_with(
             url,
             data=mock_monitor_instance,
             params={"auth_token": "test_token"},
@@ -124,6 +261,30 @@ class TestFileOperations(unittest.TestCase):
         )
         self.assertEqual(response, mock_response)
 
+    @patch.multiple(
+        "zindi.utils", MultipartEncoder=DEFAULT, MultipartEncoderMonitor=DEFAULT
+    )
+    def test_upload_reads_auth_token_header(self, **mocks):
+        """Test the upload query parameter comes from the ``auth-token`` header."""
+        mocks["MultipartEncoder"].return_value.len = 5000
+        mocks["MultipartEncoderMonitor"].return_value.content_type = "mock/type"
+        self.mock_open_func.return_value = io.BytesIO(b"file content")
+        session = Mock()
+
+        utils.upload(
+            filepath="submission.csv",
+            comment="",
+            url="http://example.com/upload",
+            headers={"auth-token": "test_token"},
+            session=session,
+        )
+
+        session.post.assert_called_once()
+        self.mock_post.assert_not_called()
+        kwargs = session.post.call_args.kwargs
+        self.assertEqual(kwargs["params"], {"auth_token": "test_token"})
+        self.assertEqual(kwargs["headers"]["auth-token"], "test_token")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,37 +1,45 @@
+import datetime
 import unittest
 from unittest.mock import patch
 
-import pandas as pd
-
 from zindi import utils
 
 # Sample data needed for printing tests
-SAMPLE_CHALLENGES_DATA = pd.DataFrame(
-    [
-        {
-            "id": "challenge-1-long-id-string-that-needs-truncating",
-            "kind": "competition",
-            "subtitle": "Challenge 1 Subtitle",
-            "reward": "prize",
-            "type_of_problem": ["Classification"],
-            "data_type": ["Tabular"],
-            "secret_code_required": False,
-            "sealed": False,
-        },
-        {
-            "id": "challenge-2",
-            "kind": "hackathon",
-            "subtitle": "Challenge 2 Subtitle",
-            "reward": "points",
-            "type_of_problem": [],  # Empty problem type
-            "data_type": ["Image"],
-            "secret_code_required": True,  # Private
-            "sealed": False,
-        },
-    ]
+_CHALLENGE_COLUMNS = (
+    "id",
+    "kind",
+    "subtitle",
+    "reward",
+    "type_of_problem",
+    "data_type",
+    "secret_code_required",
+    "sealed",
+)
+# Challenge rows, turned into a DataFrame only by the test that prints them
+_CHALLENGE_ROWS = (
+    (
+        "challenge-1-long-id-string-that-needs-truncating",
+        "competition",
+        "Challenge 1 Subtitle",
+        "prize",
+        ["Classification"],
+        ["Tabular"],
+        False,
+        False,
+    ),
+    (
+        "challenge-2",
+        "hackathon",
+        "Challenge 2 Subtitle",
+        "points",
+        [],  # Empty problem type
+        ["Image"],
+        True,  # Private
+        False,
+    ),
 )
 
-SAMPLE_LEADERBOARD_DATA = [
+SAMPLE_LEADERBOARD_DATA = (
     {
         "public_rank": 1,
         "best_public_score": 0.95,
@@ -67,9 +75,9 @@ SAMPLE_LEADERBOARD_DATA = [
         "submission_count": 0,
         "best_public_submitted_at": None,
     },
-]
+)
 
-SAMPLE_SUBMISSION_BOARD_DATA = [
+SAMPLE_SUBMISSION_BOARD_DATA = (
     {
         "id": "sub-1",
         "status": "successful",
@@ -100,132 +108,131 @@ SAMPLE_SUBMISSION_BOARD_DATA = [
         "comment": "Failed one",
         "status_description": "Invalid file format provided by user.",
     },
-]
+)
+
+
+# Table templates used by the printers, bound once as ``str.format`` callables
+CHALLENGE_ROW = "|{:^5}|{:^14.14}|{:^18.18}|{:^20.20}| {:10}".format
+LB_HEADER = "|{:^6}|{:^20}|{:^44}|{:^12}|{:^12}".format
+LB_ROW = "|{:^6}|{:^20.20}|{:^44.44}|{:^12.12}|{:^12}".format
+SUBMISSION_HEADER = "|{:^6}|{:^10}|{:^18}|{:^16}|{:^30} |{:^25}".format
+SUBMISSION_ROW = "|{:^5}|{:^10}|{:^12}| {:^14.14} |{:30.30} |{:40.40}".format
+
+# Rows each print test expects to find among the printed lines
+EXPECTED_CHALLENGE_ROWS = frozenset(
+    {
+        # First challenge (public competition)
+        CHALLENGE_ROW(
+            0,
+            "Public Compet",
+            "Classification",
+            "prize",
+            "challenge-1-long-id-string-that-needs-truncating..."[:10],
+        ),
+        # Second challenge (private hackathon, no problem type)
+        CHALLENGE_ROW(1, "Private Hack", "", "points", "challenge-2"[:10]),
+    }
+)
+EXPECTED_LB_ROWS = frozenset(
+    {
+        # Header
+        LB_HEADER("rank", "score", "name", "counter", "last_submission"),
+        # User row (marked with green circle)
+        LB_ROW("2", "0.92", "testuser 🟢", "3", "09 January 2023, 15:30"),
+        # Team row
+        LB_ROW("3", "0.9", "TEAM - Team Awesome", "8", ""),
+        # Private rank row
+        LB_ROW("4", "0.88", "anotheruser", "2", "12 January 2023, 11:00"),
+    }
+)
+EXPECTED_SUBMISSION_ROWS = frozenset(
+    {
+        # Header
+        SUBMISSION_HEADER("status", "id", "date", "score", "filename", "comment"),
+        # Successful submission row
+        SUBMISSION_ROW(
+            "🟢",
+            "sub-1",
+            "10 Jan 2023, 10:00",
+            "0.91",
+            "submission1.csv",
+            "First attempt",
+        ),
+        # Initial/processing submission row
+        SUBMISSION_ROW(
+            "🟢",
+            "sub-2",
+            "11 Jan 2023, 11:00",
+            "In processing",
+            "submission2_long_filename_to_",
+            "",
+        ),
+        # Failed submission row
+        SUBMISSION_ROW(
+            "🔴",
+            "sub-3",
+            "12 Jan 2023, 12:00",
+            "-",
+            "submission3.csv",
+            "Invalid file format provided by user.",
+        ),
+    }
+)
+
+
+def _printed_lines(mock_print):
+    """Collect the first positional argument of every recorded print call."""
+    return {c.args[0] for c in mock_print.call_args_list if c.args}
+
+
+def _fake_to_datetime(timestamp):
+    """Parse the fixtures' UTC timestamps without pandas (or its timezone)."""
+    return datetime.datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%SZ")
 
 
 # --- Test Class for Printing Functions ---
 class TestPrinting(unittest.TestCase):
+    def setUp(self):
+        """Swap pandas' datetime parsing for a deterministic, stateless fake."""
+        patcher = patch("zindi.utils.pd.to_datetime", new=_fake_to_datetime)
+        self.addCleanup(patcher.stop)
+        patcher.start()
+
     @patch("builtins.print")
     def _print_challenges(self, mock_print):
         """Test printing challenges table."""
-        utils.print_challenges(SAMPLE_CHALLENGES_DATA)
+        import pandas as pd
+
+        challenges = pd.DataFrame.from_records(
+            _CHALLENGE_ROWS, columns=_CHALLENGE_COLUMNS
+        )
+        utils.print_challenges(challenges)
         # Check if print was called multiple times (header, separator, rows)
         self.assertGreater(mock_print.call_count, 5)
-        # Check specific row content (e.g., first challenge)
-        mock_print.assert_any_call(
-            "|{:^5}|{:^14.14}|{:^18.18}|{:^20.20}| {:10}".format(
-                0,
-                "Public Compet",
-                "Classification",
-                "prize",
-                "challenge-1-long-id-string-that-needs-truncating..."[:10],
-            )
-        )
-        # Check second challenge (private hackathon, no problem type)
-        mock_print.assert_any_call(
-            "|{:^5}|{:^14.14}|{:^18.18}|{:^20.20}| {:10}".format(
-                1, "Private Hack", "", "points", "challenge-2"[:10]
-            )
-        )
+        self.assertEqual(EXPECTED_CHALLENGE_ROWS - _printed_lines(mock_print), set())
 
     @patch("builtins.print")
-    @patch(
-        "zindi.utils.pd.to_datetime"
-    )  # Mock datetime conversion for consistent output
-    def test_print_lb(self, mock_to_datetime, mock_print):
+    def test_print_lb(self, mock_print):
         """Test printing leaderboard table."""
-        # Mock datetime conversion to return predictable strings
-        mock_to_datetime.return_value.strftime.side_effect = [
-            "10 January 2023, 10:00",  # leader
-            "09 January 2023, 15:30",  # testuser
-            # None for Team Awesome
-            "12 January 2023, 11:00",  # anotheruser (private)
-        ]
-
         user_rank = 2  # Rank of 'testuser'
         utils.print_lb(SAMPLE_LEADERBOARD_DATA, user_rank)
 
         self.assertGreater(mock_print.call_count, 5)
-        # Check header
-        mock_print.assert_any_call(
-            "|{:^6}|{:^20}|{:^44}|{:^12}|{:^12}".format(
-                "rank", "score", "name", "counter", "last_submission"
-            )
-        )
-        # Check user row (marked with green circle)
-        mock_print.assert_any_call(
-            "|{:^6}|{:^20.20}|{:^44.44}|{:^12.12}|{:^12}".format(
-                "2", "0.92", "testuser 🟢", "3", "09 January 2023, 15:30"
-            )
-        )
-        # Check team row
-        mock_print.assert_any_call(
-            "|{:^6}|{:^20.20}|{:^44.44}|{:^12.12}|{:^12}".format(
-                "3", "0.9", "TEAM - Team Awesome", "8", ""
-            )
-        )
-        # Check private rank row
-        mock_print.assert_any_call(
-            "|{:^6}|{:^20.20}|{:^44.44}|{:^12.12}|{:^12}".format(
-                "4", "0.88", "anotheruser", "2", "12 January 2023, 11:00"
+        self.assertEqual(EXPECTED_LB_ROWS - _printed_lines(mock_print), set())
+        # Ensure the row with rank None was skipped (check call count or absence of 'inactiveuser')
+        self.assertFalse(
+            any(
+                "inactiveuser" in c.args[0] for c in mock_print.call_args_list if c.args
             )
         )
-        # Ensure the row with rank None was skipped (check call count or absence of 'inactiveuser')
-        print_calls = [args[0] for args, kwargs in mock_print.call_args_list]
-        self.assertFalse(any("inactiveuser" in call_str for call_str in print_calls))
 
     @patch("builtins.print")
-    @patch("zindi.utils.pd.to_datetime")
-    def _print_submission_board(self, mock_to_datetime, mock_print):
+    def _print_submission_board(self, mock_print):
         """Test printing submission board table."""
-        mock_to_datetime.return_value.strftime.side_effect = [
-            "10 Jan 2023, 10:00",  # sub-1
-            "11 Jan 2023, 11:00",  # sub-2
-            "12 Jan 2023, 12:00",  # sub-3
-        ]
-
         utils.print_submission_board(SAMPLE_SUBMISSION_BOARD_DATA)
 
         self.assertGreater(mock_print.call_count, 4)
-        # Check header
-        mock_print.assert_any_call(
-            "|{:^6}|{:^10}|{:^18}|{:^16}|{:^30} |{:^25}".format(
-                "status", "id", "date", "score", "filename", "comment"
-            )
-        )
-        # Check successful submission row
-        mock_print.assert_any_call(
-            "|{:^5}|{:^10}|{:^12}| {:^14.14} |{:30.30} |{:40.40}".format(
-                "🟢",
-                "sub-1",
-                "10 Jan 2023, 10:00",
-                "0.91",
-                "submission1.csv",
-                "First attempt",
-            )
-        )
-        # Check initial/processing submission row
-        mock_print.assert_any_call(
-            "|{:^5}|{:^10}|{:^12}| {:^14.14} |{:30.30} |{:40.40}".format(
-                "🟢",
-                "sub-2",
-                "11 Jan 2023, 11:00",
-                "In processing",
-                "submission2_long_filename_to_",
-                "",
-            )
-        )
-        # Check failed submission row
-        mock_print.assert_any_call(
-            "|{:^5}|{:^10}|{:^12}| {:^14.14} |{:30.30} |{:40.40}".format(
-                "🔴",
-                "sub-3",
-                "12 Jan 2023, 12:00",
-                "-",
-                "submission3.csv",
-                "Invalid file format provided by user.",
-            )
-        )
+        self.assertEqual(EXPECTED_SUBMISSION_ROWS - _printed_lines(mock_print), set())
 
 
 if __name__ == "__main__":
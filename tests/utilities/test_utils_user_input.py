@@ -4,28 +4,32 @@ from unittest.mock import patch
 from zindi import utils
 
 
+def _answers(*replies):
+    """Stand-in for ``input`` that returns ``replies`` one at a time."""
+    replies = iter(replies)
+    return replies, lambda prompt="": next(replies)
+
+
 # --- Test Class for User Input Functions ---
 class TestUserInput(unittest.TestCase):
-    @patch(
-        "builtins.input", side_effect=["abc", "-1", "100", "1", "q"]
-    )  # Invalid, invalid, invalid, valid, quit
     @patch("builtins.print")
-    def test_challenge_idx_selector(self, mock_print, mock_input):
+    def test_challenge_idx_selector(self, mock_print):
         """Test challenge index selector with various inputs."""
         n_challenges = 3
 
         # Test invalid inputs then valid
-        index = utils.challenge_idx_selector(n_challenges)
-        self.assertEqual(mock_input.call_count, 4)  # abc, -1, 100, 1
+        remaining, fake_input = _answers("abc", "-1", "100", "1", "q")
+        with patch("builtins.input", new=fake_input):
+            index = utils.challenge_idx_selector(n_challenges)
+        self.assertEqual(list(remaining), ["q"])  # abc, -1, 100, 1 were consumed
         self.assertEqual(mock_print.call_count, 3)  # Error messages
         self.assertEqual(index, 1)
 
-        # Reset mock and test quit
-        mock_input.reset_mock()
-        mock_print.reset_mock()
-        mock_input.side_effect = ["q"]
-        index = utils.challenge_idx_selector(n_challenges)
-        self.assertEqual(mock_input.call_count, 1)
+        # Test quit
+        remaining, fake_input = _answers("q")
+        with patch("builtins.input", new=fake_input):
+            index = utils.challenge_idx_selector(n_challenges)
+        self.assertEqual(list(remaining), [])
         self.assertEqual(index, -1)
 
 
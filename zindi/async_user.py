@@ -0,0 +1,64 @@
+import asyncio
+
+from zindi.user import Zindian
+
+
+class AsyncZindian:
+    """Awaitable facade over Zindian that runs each blocking call in a thread.
+
+    Independent operations can then be awaited together, e.g.
+    ``await asyncio.gather(user.my_rank(), user.remaining_subimissions())``.
+    Calls that change the selected challenge should not run concurrently with
+    calls that depend on it.
+    """
+
+    def __init__(self, zindian: Zindian):
+        self.zindian = zindian
+
+    @classmethod
+    async def signin(cls, *args, **kwargs):
+        """Create a signed-in Zindian without blocking the event loop."""
+        return cls(await asyncio.to_thread(Zindian, *args, **kwargs))
+
+    async def __run(self, method, *args, **kwargs):
+        return await asyncio.to_thread(method, *args, **kwargs)
+
+    @property
+    def which_challenge(self):
+        return self.zindian.which_challenge
+
+    async def my_rank(self):
+        return await self.__run(lambda: self.zindian.my_rank)
+
+    async def remaining_subimissions(self):
+        return await self.__run(lambda: self.zindian.remaining_subimissions)
+
+    async def search_competitions(self, *args, **kwargs):
+        return await self.__run(self.zindian.search_competitions, *args, **kwargs)
+
+    async def select_a_challenge(self, *args, **kwargs):
+        return await self.__run(self.zindian.select_a_challenge, *args, **kwargs)
+
+    async def download_dataset(self, *args, **kwargs):
+        return await self.__run(self.zindian.download_dataset, *args, **kwargs)
+
+    async def submit(self, *args, **kwargs):
+        return await self.__run(self.zindian.submit, *args, **kwargs)
+
+    async def leaderboard(self, *args, **kwargs):
+        return await self.__run(self.zindian.leaderboard, *args, **kwargs)
+
+    async def submission_board(self, *args, **kwargs):
+        return await self.__run(self.zindian.submission_board, *args, **kwargs)
+
+    async def create_team(self, *args, **kwargs):
+        return await self.__run(self.zindian.create_team, *args, **kwargs)
+
+    async def team_up(self, *args, **kwargs):
+        return await self.__run(self.zindian.team_up, *args, **kwargs)
+
+    async def disband_team(self):
+        return await self.__run(self.zindian.disband_team)
+
+    async def close(self):
+        await self.__run(self.zindian.close)
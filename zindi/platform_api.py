@@ -1,40 +1,100 @@
+try:  # optional faster JSON parser, see the "orjson" extra
+    import orjson as json
+except ImportError:
+    import json
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from zindi.utils import upload
 
+# Idempotent requests are retried with exponential backoff on transient errors;
+# the last response is still returned so its error payload can be reported.
+_RETRIES = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET", "HEAD", "DELETE"}),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+
+class ZindiAPIError(Exception):
+    """Error reported by the Zindi API, or a response it could not be read from."""
+
+    def __init__(self, message, status_code=None):
+        super().__init__(message)
+        self.status_code = status_code
+
 
 class ZindiPlatformAPI:
     """Low-level Zindi HTTP client that returns JSON data payloads."""
 
-    def __init__(self, base_api: str, default_headers: dict):
+    def __init__(
+        self, base_api: str, default_headers: dict, session: requests.Session = None
+    ):
         self.base_api = base_api
         self.default_headers = default_headers
+        self._headers_cache = {}
+        # A caller-provided session (e.g. with a custom transport adapter) is
+        # used as is and left open; otherwise one pooled session is owned here.
+        self._owns_session = session is None
+        if session is None:
+            session = requests.Session()
+            session.mount(
+                "https://",
+                HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=_RETRIES),
+            )
+        self.session = session
+
+    def close(self):
+        """Release the pooled connections of the session this client created."""
+        if self._owns_session:
+            self.session.close()
 
     def _response_data(self, response):
         try:
-            payload = response.json()
+            payload = json.loads(response.content)
         except ValueError:
             body_preview = (response.text or "").strip().replace("\n", " ")[:240]
-            raise Exception(
+            raise ZindiAPIError(
                 f"[ 🔴 ] Invalid non-JSON response from Zindi API "
-                f"(status={response.status_code}). Body preview: {body_preview}"
+                f"(status={response.status_code}). Body preview: {body_preview}",
+                status_code=response.status_code,
+            )
+        data = payload.get("data", payload)
+        # Error payloads are returned to the callers that handle them; only
+        # HTTP failures without one are raised here.
+        if response.status_code >= 400 and not (
+            isinstance(data, dict) and "errors" in data
+        ):
+            raise ZindiAPIError(
+                f"[ 🔴 ] Zindi API request failed (status={response.status_code}): {data}",
+                status_code=response.status_code,
             )
-        return payload.get("data", payload)
+        return data
 
     def _raise_on_errors(self, data):
         if "errors" in data:
-            raise Exception(f"[ 🔴 ] {data['errors']}")
+            raise ZindiAPIError(f"[ 🔴 ] {data['errors']}")
         return data
 
     def _auth_headers(self, auth_token: str, current_url: str = None):
-        headers = {**self.default_headers, "auth-token": auth_token}
-        if current_url is not None:
-            headers["current-url"] = current_url
+        # Built once per token/page pair and shared: callers must not mutate them.
+        key = (auth_token, current_url)
+        headers = self._headers_cache.get(key)
+        if headers is None:
+            headers = {**self.default_headers, "auth-token": auth_token}
+            if current_url is not None:
+                headers["current-url"] = current_url
+            self._headers_cache[key] = headers
         return headers
 
     def signin(self, username: str, password: str):
         url = "https://api.zindi.africa/v1/auth/signin"
-        response = requests.post(
+        response = self.session.post(
             url,
             data={"username": username, "password": password},
             headers=self.default_headers,
@@ -64,7 +124,7 @@ class ZindiPlatformAPI:
             "prize": reward_value,
         }
         params = {k: v for k, v in params.items() if v is not None}
-        response = requests.get(
+        response = self.session.get(
             url,
             headers=self._auth_headers(
                 auth_token, current_url="https://zindi.africa/competitions"
@@ -76,7 +136,7 @@ class ZindiPlatformAPI:
 
     def get_competition(self, auth_token: str, challenge_id: str):
         url = f"{self.base_api}/{challenge_id}"
-        response = requests.get(
+        response = self.session.get(
             url,
             headers=self._auth_headers(
                 auth_token, current_url="https://zindi.africa/competitions"
@@ -90,7 +150,7 @@ class ZindiPlatformAPI:
     ):
         url = f"{self.base_api}/{challenge_id}/participations"
         params = {"secret_code": secret_code} if secret_code else None
-        response = requests.post(
+        response = self.session.post(
             url, headers=self._auth_headers(auth_token), params=params
         )
         data = self._response_data(response)
@@ -101,12 +161,12 @@ class ZindiPlatformAPI:
                 "Great news! You've already joined the competition",
             }:
                 return {"joined": True, "message": message}
-            raise Exception(f"\n[ 🔴 ] {message}\n")
+            raise ZindiAPIError(f"\n[ 🔴 ] {message}\n")
         return {"joined": True, "message": data}
 
     def get_submission_limits(self, auth_token: str, challenge_id: str):
         url = f"{self.base_api}/{challenge_id}/submissions/limits"
-        response = requests.get(
+        response = self.session.get(
             url,
             headers=self._auth_headers(
                 auth_token, current_url=f"{self.base_api}/{challenge_id}/submit"
@@ -117,7 +177,7 @@ class ZindiPlatformAPI:
 
     def get_my_participation(self, auth_token: str, challenge_id: str):
         url = f"{self.base_api}/{challenge_id}/participations/my_participation"
-        response = requests.get(
+        response = self.session.get(
             url,
             headers=self._auth_headers(
                 auth_token,
@@ -131,9 +191,9 @@ class ZindiPlatformAPI:
         self, auth_token: str, challenge_id: str, per_page: int = 50, page: int = 0
     ):
         url = f"{self.base_api}/{challenge_id}/participations"
-        response = requests.get(
+        response = self.session.get(
             url,
-            headers={**self.default_headers, "auth_token": auth_token},
+            headers=self._auth_headers(auth_token),
             params={"page": page, "per_page": per_page},
         )
         data = self._response_data(response)
@@ -143,10 +203,9 @@ class ZindiPlatformAPI:
         self, auth_token: str, challenge_id: str, per_page: int = 50
     ):
         url = f"{self.base_api}/{challenge_id}/submissions"
-        response = requests.get(
+        response = self.session.get(
             url,
             headers=self._auth_headers(auth_token),
-            data={"auth-token": auth_token},
             params={"per_page": per_page},
         )
         data = self._response_data(response)
@@ -160,16 +219,17 @@ class ZindiPlatformAPI:
             filepath=filepath,
             comment=comment,
             url=url,
-            headers={**self.default_headers, "auth_token": auth_token},
+            headers=self._auth_headers(auth_token),
+            session=self.session,
         )
         data = self._response_data(response)
         return data
 
     def create_team(self, auth_token: str, challenge_id: str, team_name: str):
         url = f"{self.base_api}/{challenge_id}/my_team"
-        response = requests.post(
+        response = self.session.post(
             url,
-            headers=self.default_headers,
+            headers=self._auth_headers(auth_token),
             data={"title": team_name, "auth_token": auth_token},
         )
         data = self._response_data(response)
@@ -177,17 +237,19 @@ class ZindiPlatformAPI:
 
     def invite_to_team(self, auth_token: str, challenge_id: str, username: str):
         url = f"{self.base_api}/{challenge_id}/my_team/invite"
-        response = requests.post(
-            url, headers=self.default_headers, data={"username": username}
+        response = self.session.post(
+            url,
+            headers=self._auth_headers(auth_token),
+            data={"username": username},
         )
         data = self._response_data(response)
         return data
 
     def disband_team(self, auth_token: str, challenge_id: str):
         url = f"{self.base_api}/{challenge_id}/my_team"
-        response = requests.delete(
+        response = self.session.delete(
             url,
-            headers=self.default_headers,
+            headers=self._auth_headers(auth_token),
             data={"auth_token": auth_token},
         )
         data = self._response_data(response)
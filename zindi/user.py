@@ -1,9 +1,12 @@
 # Imports
 
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from getpass import getpass
 
 import pandas as pd
+import requests
 
 from zindi.models import (
     ChallengeSelectionResult,
@@ -12,7 +15,7 @@ from zindi.models import (
     SubmissionBoardResult,
     SubmissionEntry,
 )
-from zindi.platform_api import ZindiPlatformAPI
+from zindi.platform_api import ZindiAPIError, ZindiPlatformAPI
 from zindi.utils import (
     challenge_idx_selector,
     download,
@@ -22,6 +25,8 @@ from zindi.utils import (
     user_on_lb,
 )
 
+_ALLOWED_EXTENSIONS = frozenset({".csv"})  # accepted submission file types
+
 
 class Zindian:
     """High-level user class for Zindi interactions with optional console output."""
@@ -33,6 +38,7 @@ class Zindian:
         to_print=True,
         api_client=None,
         return_models=False,
+        cache_ttl=5.0,
     ):
         self.__headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/144.0.0.0 Safari/537.36"
@@ -46,6 +52,55 @@ class Zindian:
         )
         self.__auth_data = self.__signin(username, fixed_password)
         self.__challenge_selected = False
+        self.__cache_ttl = cache_ttl
+        self.__cache = {}
+
+    def close(self):
+        """Close the API client's pooled HTTP connections."""
+        close = getattr(self.__api_client, "close", None)
+        if close is not None:
+            close()
+
+    def invalidate_cache(self):
+        """Forget cached API responses so the next access fetches fresh data."""
+        self.__cache = {}
+
+    def __fresh(self, key):
+        """Return the cached value for ``key`` if younger than ``cache_ttl``."""
+        entry = self.__cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.__cache_ttl:
+            return entry[1]
+        return None
+
+    def __cached(self, key, fetch):
+        """Return ``fetch()``, reusing its result for ``cache_ttl`` seconds."""
+        value = self.__fresh(key)
+        if value is None:
+            value = fetch()
+            self.__cache[key] = (time.monotonic(), value)
+        return value
+
+    def __fetch_leaderboard(self, challenge_id, per_page):
+        """Fetch leaderboard rows and keep them for rank lookups by my_rank."""
+        rows = self.__api_client.get_leaderboard(
+            auth_token=self.__auth_data["auth_token"],
+            challenge_id=challenge_id,
+            per_page=per_page,
+        )
+        self.__challengers_data = rows
+        self.__cache[("leaderboard", challenge_id)] = (time.monotonic(), rows)
+        return rows
+
+    def __participation_rank(self, challenge_id):
+        """Public rank reported by the my_participation endpoint (0 if unranked)."""
+        response_data = self.__cached(
+            ("my_participation", challenge_id),
+            lambda: self.__api_client.get_my_participation(
+                auth_token=self.__auth_data["auth_token"],
+                challenge_id=challenge_id,
+            ),
+        )
+        return response_data.get("public_rank", 0) or 0
 
     def __emit(self, message, to_print=None):
         should_print = self.__to_print if to_print is None else to_print
@@ -61,18 +116,20 @@ class Zindian:
             raise Exception(error_msg)
         return self.__challenge_data["id"]
 
-    def __rank_from_leaderboard_rows(self, rows):
+    def __rank_from_leaderboard_rows(
+        self, rows, fields=("private_rank", "public_rank")
+    ):
         """Resolve user rank directly from leaderboard rows.
 
-        This is a robust fallback when dedicated rank endpoints return 0.
+        ``fields`` are read in order; pass ``("public_rank",)`` when the row
+        stands in for the my_participation endpoint, which reports that rank.
         """
 
         username = self.__auth_data["user"]["username"]
         for row in rows:
             user = row.get("user") or {}
-            rank = row.get("private_rank")
-            if rank is None:
-                rank = row.get("public_rank")
+            ranks = (row.get(field) for field in fields)
+            rank = next((rank for rank in ranks if rank is not None), None)
             if user.get("username") == username and rank is not None:
                 return int(rank)
         return 0
@@ -85,26 +142,23 @@ class Zindian:
 
     @property
     def my_rank(self):
+        """Rank on the selected challenge; calls the API, cached for ``cache_ttl``."""
         if not self.__challenge_selected:
             return 0
         challenge_id = self.__require_challenge()
-        int_rank = 0
-        response_data = self.__api_client.get_my_participation(
-            auth_token=self.__auth_data["auth_token"],
-            challenge_id=challenge_id,
+        # Rows fetched by a recent leaderboard() call already hold the rank.
+        rows = self.__fresh(("leaderboard", challenge_id))
+        int_rank = (
+            self.__rank_from_leaderboard_rows(rows, fields=("public_rank",))
+            if rows
+            else 0
         )
-        int_rank = response_data.get("public_rank", 0) or 0
+        if int_rank == 0:
+            int_rank = self.__participation_rank(challenge_id)
 
         # Fallback: if dedicated endpoint reports 0, infer from leaderboard rows.
-        if int_rank == 0:
-            rows = getattr(self, "_Zindian__challengers_data", None)
-            if rows is None:
-                rows = self.__api_client.get_leaderboard(
-                    auth_token=self.__auth_data["auth_token"],
-                    challenge_id=challenge_id,
-                    per_page=500,
-                )
-                self.__challengers_data = rows
+        if int_rank == 0 and rows is None:
+            rows = self.__fetch_leaderboard(challenge_id, per_page=500)
             int_rank = self.__rank_from_leaderboard_rows(rows)
 
         self.__rank = int_rank
@@ -112,21 +166,27 @@ class Zindian:
 
     @property
     def remaining_subimissions(self):
+        """Submissions left today; calls the API, cached for ``cache_ttl``."""
         if not self.__challenge_selected:
             return None
         challenge_id = self.__require_challenge()
-        response_data = self.__api_client.get_submission_limits(
-            auth_token=self.__auth_data["auth_token"],
-            challenge_id=challenge_id,
+        response_data = self.__cached(
+            ("submission_limits", challenge_id),
+            lambda: self.__api_client.get_submission_limits(
+                auth_token=self.__auth_data["auth_token"],
+                challenge_id=challenge_id,
+            ),
         )
         return response_data.get("today")
 
     def __signin(self, username, fixed_password=None):
-        password = (
-            fixed_password
-            if fixed_password is not None
-            else getpass(prompt="Your password\n>> ")
-        )
+        # Non-interactive runs (CI, batch jobs) can provide ZINDI_PASSWORD instead.
+        if fixed_password is not None:
+            password = fixed_password
+        else:
+            password = os.environ.get("ZINDI_PASSWORD") or getpass(
+                prompt="Your password\n>> "
+            )
         response = self.__api_client.signin(username=username, password=password)
         self.__emit(
             f"\n[ 🟢 ] 👋🏾👋🏾 Welcome {response['user']['username'] } 👋🏾👋🏾\n"
@@ -280,6 +340,7 @@ class Zindian:
         challenge_id = self.__challenge_data["id"]
         self.__api = f"{self.__base_api}/{challenge_id}"
         self.__challenge_selected = True
+        self.invalidate_cache()
 
         self.__emit(
             f"\n[ 🟢 ] You choose the challenge : {self.__challenge_data['id']},\n\t{self.__challenge_data.get('subtitle', '')}.\n",
@@ -294,7 +355,9 @@ class Zindian:
         use_model = self.__return_models if as_model is None else as_model
         return ChallengeSelectionResult.from_raw(result) if use_model else result
 
-    def download_dataset(self, destination=".", make_destination=True):
+    def download_dataset(
+        self, destination=".", make_destination=True, max_workers=4, resume=False
+    ):
         challenge_id = self.__require_challenge()
         if not os.path.isdir(destination) and make_destination:
             os.makedirs(destination, exist_ok=True)
@@ -303,36 +366,83 @@ class Zindian:
             auth_token=self.__auth_data["auth_token"],
             challenge_id=challenge_id,
         )
-        datafiles = []
-        for item in challenge_data.get("datafiles", []):
-            if item not in datafiles:
-                datafiles.append(item)
+        # Files are stored by name, so keep one datafile entry per filename.
+        by_filename = {
+            item["filename"]: item for item in challenge_data.get("datafiles", [])
+        }
+        datafiles = list(by_filename.values())
 
         headers = {**self.__headers, "auth_token": self.__auth_data["auth_token"]}
-        downloaded_files = []
-        for item in datafiles:
-            filename = os.path.join(destination, item["filename"])
-            download(
-                url=f"{self.__base_api}/{challenge_id}/files/{item['filename']}",
-                filename=filename,
-                headers=headers,
-            )
-            downloaded_files.append(filename)
+        session = getattr(self.__api_client, "session", None)
+        downloaded_files = [
+            os.path.join(destination, item["filename"]) for item in datafiles
+        ]
+        # Datafiles are independent, so fetch them concurrently.
+        n_workers = max(1, min(max_workers, len(datafiles)))
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            futures = [
+                executor.submit(
+                    download,
+                    url=f"{self.__base_api}/{challenge_id}/files/{item['filename']}",
+                    filename=filename,
+                    headers=headers,
+                    session=session,
+                    resume=resume,
+                )
+                for item, filename in zip(datafiles, downloaded_files)
+            ]
+            for future in futures:
+                future.result()  # re-raise the first download error, if any
         return downloaded_files
 
-    def submit(self, filepaths=None, comments=None, to_print=None):
+    def submit(self, filepaths=None, comments=None, to_print=None, max_workers=4):
         filepaths = filepaths or []
         comments = comments or []
         challenge_id = self.__require_challenge()
 
-        allowed_extensions = {"csv"}
         if len(comments) < len(filepaths):
             comments = comments + ([""] * (len(filepaths) - len(comments)))
 
-        submissions = []
+        # Validate every file first, so only the uploads run concurrently.
+        checked = []
         for filepath, comment in zip(filepaths, comments):
-            extension = filepath.split(".")[-1].strip().lower()
-            if extension not in allowed_extensions:
+            extension = os.path.splitext(filepath)[1].strip().lower()
+            if extension not in _ALLOWED_EXTENSIONS:
+                error = "invalid_extension"
+            elif not os.path.isfile(filepath):
+                error = "file_not_found"
+            else:
+                error = None
+            checked.append((filepath, comment, error))
+
+        def submit_file(filepath, comment):
+            # A failed upload is reported for its own file, not for the batch.
+            try:
+                return self.__api_client.submit_file(
+                    auth_token=self.__auth_data["auth_token"],
+                    challenge_id=challenge_id,
+                    filepath=filepath,
+                    comment=comment,
+                )
+            except (ZindiAPIError, requests.RequestException, OSError) as error:
+                return {
+                    "errors": str(error),
+                    "status_code": getattr(error, "status_code", None),
+                }
+
+        to_upload = [(fp, comment) for fp, comment, error in checked if error is None]
+        n_workers = max(1, min(max_workers, len(to_upload)))
+        try:
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                futures = [executor.submit(submit_file, *task) for task in to_upload]
+                responses = iter([future.result() for future in futures])
+        finally:
+            if to_upload:
+                self.invalidate_cache()  # rank and submission limits may have changed
+
+        submissions = []
+        for filepath, comment, error in checked:
+            if error == "invalid_extension":
                 self.__emit(
                     f"\n[ 🔴 ] Submission file must be a CSV file ( .csv ),\n\tplease verify this filepath : {filepath}\n",
                     to_print=to_print,
@@ -346,7 +456,7 @@ class Zindian:
                 )
                 continue
 
-            if not os.path.isfile(filepath):
+            if error == "file_not_found":
                 self.__emit(
                     f"\n[ 🔴 ] File doesn't exists, please verify this filepath : {filepath}\n",
                     to_print=to_print,
@@ -360,12 +470,7 @@ class Zindian:
                 )
                 continue
 
-            response = self.__api_client.submit_file(
-                auth_token=self.__auth_data["auth_token"],
-                challenge_id=challenge_id,
-                filepath=filepath,
-                comment=comment,
-            )
+            response = next(responses)
             if "errors" in response:
                 self.__emit(
                     f"\n[ 🔴 ] Something wrong with file :{filepath} ,\n{response['errors']}\n",
@@ -376,6 +481,7 @@ class Zindian:
                         "filepath": filepath,
                         "status": "error",
                         "errors": response["errors"],
+                        "status_code": response.get("status_code"),
                     }
                 )
             else:
@@ -394,20 +500,16 @@ class Zindian:
 
     def leaderboard(self, to_print=True, per_page=50, as_model=None):
         challenge_id = self.__require_challenge()
-        self.__challengers_data = self.__api_client.get_leaderboard(
-            auth_token=self.__auth_data["auth_token"],
-            challenge_id=challenge_id,
-            per_page=per_page,
+        self.__fetch_leaderboard(challenge_id, per_page=per_page)
+        # The user's own row answers the rank without another request.
+        self.__rank = self.__rank_from_leaderboard_rows(
+            self.__challengers_data, fields=("public_rank",)
         )
-        self.__rank = 0
-        try:
-            my_participation = self.__api_client.get_my_participation(
-                auth_token=self.__auth_data["auth_token"],
-                challenge_id=challenge_id,
-            )
-            self.__rank = my_participation.get("public_rank", 0) or 0
-        except Exception:
-            self.__rank = 0
+        if self.__rank == 0:
+            try:
+                self.__rank = self.__participation_rank(challenge_id)
+            except Exception:
+                self.__rank = 0
 
         if self.__rank == 0:
             headers = {**self.__headers, "auth_token": self.__auth_data["auth_token"]}
@@ -457,7 +559,7 @@ class Zindian:
         if ("errors" in response) and (
             "Leader can only be" not in response["errors"]["base"]
         ):
-            raise Exception(f"\n[ 🔴 ] {response['errors']['base']}\n")
+            raise ZindiAPIError(f"\n[ 🔴 ] {response['errors']['base']}\n")
 
         if ("errors" in response) and (
             "Leader can only be" in response["errors"]["base"]
@@ -481,16 +583,24 @@ class Zindian:
             )
         return {**team_response, "invites": invites}
 
-    def team_up(self, zindians=None, to_print=None):
+    def team_up(self, zindians=None, to_print=None, max_workers=5):
         zindians = zindians or []
         challenge_id = self.__require_challenge()
-        invitations = []
-        for zindian in zindians:
-            response = self.__api_client.invite_to_team(
+
+        def invite(zindian):
+            return self.__api_client.invite_to_team(
                 auth_token=self.__auth_data["auth_token"],
                 challenge_id=challenge_id,
                 username=zindian,
             )
+
+        # Send the invitations concurrently, then report them in input order.
+        n_workers = max(1, min(max_workers, len(zindians)))
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            responses = list(executor.map(invite, zindians))
+
+        invitations = []
+        for zindian, response in zip(zindians, responses):
             if "errors" in response:
                 if "is already invited" in response["errors"]["base"]:
                     self.__emit(
@@ -501,7 +611,7 @@ class Zindian:
                         {"username": zindian, "status": "already_invited"}
                     )
                 else:
-                    raise Exception(f"\n[ 🔴 ] {response['errors']}\n")
+                    raise ZindiAPIError(f"\n[ 🔴 ] {response['errors']}\n")
             else:
                 self.__emit(
                     f"\n[ 🟢 ] An invitation has been sent to join your team to: {zindian}\n",
@@ -517,6 +627,6 @@ class Zindian:
             challenge_id=challenge_id,
         )
         if "errors" in response:
-            raise Exception(f"\n[ 🔴 ] {response['errors']}\n")
+            raise ZindiAPIError(f"\n[ 🔴 ] {response['errors']}\n")
         self.__emit(f"\n[ 🟢 ] {response}\n")
         return response
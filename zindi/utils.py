@@ -8,9 +8,13 @@ from tqdm import tqdm
 
 # Utils
 
+DOWNLOAD_CHUNK_SIZE = 64 * 1024  # bytes read from the network per write
+
 
 ## Download a file
-def download(url="https://", filename="", headers: dict = {}):
+def download(
+    url="https://", filename="", headers: dict = None, session=None, resume=False
+):
     """Download a file with progress bar.
 
     Parameters
@@ -19,35 +23,76 @@ def download(url="https://", filename="", headers: dict = {}):
         The url of the file to download.
     filename : string
         The local filename of the file to download.
-    headers : dictionary
+    headers : dictionary, default=None
         The headers of the download's request.
+    session : requests.Session, default=None
+        The session used to send the request, to reuse its pooled connections.
+    resume : bool, default=False
+        Whether to continue a partial local file with an HTTP Range request.
     """
 
-    response = requests.get(
+    headers = headers or {}
+    offset = os.path.getsize(filename) if resume and os.path.isfile(filename) else 0
+    request_headers = headers
+    if offset:
+        # Range offsets count bytes of the encoded body, so ask for it unencoded.
+        request_headers = {
+            **headers,
+            "Range": f"bytes={offset}-",
+            "Accept-Encoding": "identity",
+        }
+    with (session or requests).get(
         url,
-        headers=headers,
+        headers=request_headers,
         data={"auth_token": headers.get("auth_token")},
         stream=True,
-    )
+    ) as response:
+        if offset and response.status_code == 416:
+            # Complete only if the server's total size matches the local file
+            if response.headers.get("content-range") == f"bytes */{offset}":
+                return
+        elif not (
+            offset
+            and response.status_code == 206
+            and "content-encoding" in response.headers
+        ):
+            _save_stream(response, filename, offset)
+            return
+    # The partial file cannot be continued: download it again from the start.
+    download(url=url, filename=filename, headers=headers, session=session)
+
+
+def _save_stream(response, filename, offset):
+    """Write a streamed response to ``filename``, appending after ``offset`` bytes."""
     response.raise_for_status()  # check if there is no error
+    if response.status_code != 206:  # whole file sent, start from scratch
+        offset = 0
     total = int(response.headers.get("content-length", 0))
+    written = 0
     with (
-        open(filename, "wb") as file,
+        open(filename, "ab" if offset else "wb") as file,
         tqdm(
             desc=filename,
-            total=total,
+            total=offset + total,
+            initial=offset,
             unit="o",
             unit_scale=True,
             unit_divisor=1024,
         ) as bar,
     ):
-        for data in response.iter_content(chunk_size=1024):
+        for data in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
             size = file.write(data)
+            written += size
             bar.update(size)
+    # content-length counts compressed bytes when the body is encoded
+    if total and "content-encoding" not in response.headers and written != total:
+        raise Exception(
+            f"\n[ 🔴 ] Incomplete download of {filename}: received {written} of {total} bytes.\n"
+        )
 
 
 # Upload a file
-def upload(filepath, comment, url, headers):
+def upload(filepath, comment, url, headers, session=None):
     """Upload a file with progress bar.
 
     Parameters
@@ -60,6 +105,8 @@ def upload(filepath, comment, url, headers):
         The url of the file to upload.
     headers : dictionary
         The headers of the upload's request.
+    session : requests.Session, default=None
+        The session used to send the request, to reuse its pooled connections.
 
     Returns
     -------
@@ -90,10 +137,10 @@ def upload(filepath, comment, url, headers):
             "Content-Type": multipart_monitor.content_type,
         }
 
-        response = requests.post(
+        response = (session or requests).post(
             url,
             data=multipart_monitor,
-            params={"auth_token": headers["auth_token"]},
+            params={"auth_token": headers.get("auth-token", headers.get("auth_token"))},
             headers=headers,
         )
     return response
@@ -409,7 +456,7 @@ def get_challenges(
     reward: Literal["prize", "points", "knowledge"] = None,
     active: bool = True,
     url: str = "",
-    headers: dict = {},
+    headers: dict = None,
     per_page: int = 20,
 ):
     """Get the available Zindi's challenges using filter options.
@@ -426,7 +473,7 @@ def get_challenges(
         Whether to show only active challenges.
     url : string
         The base API url for competitions.
-    headers : dictionary
+    headers : dictionary, default=None
         The headers of the request.
     per_page : int, default=20
         Number of challenges to retrieve per page.